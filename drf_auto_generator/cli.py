@@ -3,21 +3,6 @@ import logging
 import sys
 from typing import List
 
-# Use the Django-specific introspection module
-from drf_auto_generator.introspection_django import (
-    setup_django,
-    introspect_schema_django,
-    TableInfo,
-)
-
-# Keep other necessary imports
-from drf_auto_generator.config_validation import load_config
-from drf_auto_generator.mapper import build_intermediate_representation
-from drf_auto_generator.openapi_gen import generate_openapi_spec, save_openapi_spec
-
-# Change from the template-based to AST-based code generation
-from drf_auto_generator.ast_codegen_main import generate_django_code
-
 # Import colored logging
 from drf_auto_generator.colored_logging import (
     setup_colored_logging,
@@ -60,6 +45,21 @@ def main():
 
     args = parser.parse_args()
 
+    # The generation pipeline pulls in Django, Pydantic and inflect, which
+    # take seconds to import; load it only once we know we will run it
+    # (so --help returns immediately).
+    from drf_auto_generator.introspection_django import (
+        setup_django,
+        introspect_schema_django,
+        TableInfo,
+    )
+    from drf_auto_generator.config_validation import load_config
+    from drf_auto_generator.mapper import build_intermediate_representation
+    from drf_auto_generator.openapi_gen import generate_openapi_spec, save_openapi_spec
+
+    # Change from the template-based to AST-based code generation
+    from drf_auto_generator.ast_codegen_main import generate_django_code
+
     # --- Logging Setup ---
     # Configure colored logging based on command line arguments
     use_colors = not args.no_color
@@ -88,7 +88,7 @@ def main():
         # 2. Setup Django Environment (Crucial Step!)
         # This configures settings and calls django.setup()
         log_progress(logger, "Configuring Django settings for introspection...")
-        setup_django(config["databases"], config["SECRET_KEY"])
+        setup_django(config["databases"], config["SECRET_KEY"].get_secret_value())
         log_success(logger, "Django setup complete.")
 
         # 3. Introspect Database Schema (using Django connection)
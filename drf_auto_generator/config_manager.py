@@ -7,6 +7,7 @@ throughout the codebase.
 """
 
 import os
+import sys
 import yaml
 from pathlib import Path
 from typing import Dict, Any, Optional, List, Union
@@ -16,8 +17,14 @@ from abc import ABC, abstractmethod
 from .constants import DefaultConfig, SupportedDatabases, PackageVersions
 from .exceptions import ConfigurationError
 
+# Prefer the libyaml-backed loader/dumper when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _SafeLoader, CSafeDumper as _SafeDumper
+except ImportError:  # pragma: no cover - depends on the PyYAML build
+    from yaml import SafeLoader as _SafeLoader, SafeDumper as _SafeDumper
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class DatabaseConfig:
     """Database connection configuration."""
     
@@ -28,6 +35,9 @@ class DatabaseConfig:
     host: Optional[str] = "localhost"
     port: Optional[int] = None
     options: Dict[str, Any] = field(default_factory=dict)
+
+    # Connection string computed once in __post_init__ (the config is immutable)
+    _conn_str: str = field(init=False, repr=False, compare=False)
     
     def __post_init__(self):
         """Validate database configuration."""
@@ -42,6 +52,10 @@ class DatabaseConfig:
                 "Database name is required",
                 context={"provided_name": self.name}
             )
+
+        # Interned so the is_* checks against SupportedDatabases hit identity
+        object.__setattr__(self, 'engine', sys.intern(self.engine))
+        object.__setattr__(self, '_conn_str', self._build_connection_string())
     
     @property
     def is_sqlite(self) -> bool:
@@ -59,6 +73,10 @@ class DatabaseConfig:
         return self.engine == SupportedDatabases.MYSQL
     
     def get_connection_string(self) -> str:
+        """Get the database connection string."""
+        return self._conn_str
+
+    def _build_connection_string(self) -> str:
         """Generate database connection string."""
         if self.is_sqlite:
             return f"sqlite:///{self.name}"
@@ -82,7 +100,7 @@ class DatabaseConfig:
         return "".join(conn_parts)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class GenerationConfig:
     """Code generation configuration."""
     
@@ -117,9 +135,11 @@ class GenerationConfig:
                 f"Invalid relation_style: {self.relation_style}",
                 context={"valid_options": ["pk", "object", "hyperlink"]}
             )
+
+        object.__setattr__(self, 'relation_style', sys.intern(self.relation_style))
         
-        # Ensure output directory is absolute
-        self.output_dir = str(Path(self.output_dir).resolve())
+        # Ensure output directory is absolute (instances are frozen)
+        object.__setattr__(self, 'output_dir', str(Path(self.output_dir).resolve()))
     
     @property
     def should_exclude_table(self) -> bool:
@@ -145,7 +165,7 @@ class GenerationConfig:
         return True
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ProjectConfig:
     """Complete project configuration."""
     
@@ -154,7 +174,11 @@ class ProjectConfig:
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary representation."""
-        return asdict(self)
+        # Skip private computed fields so the result round-trips through from_dict
+        return asdict(
+            self,
+            dict_factory=lambda items: {k: v for k, v in items if not k.startswith('_')}
+        )
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'ProjectConfig':
@@ -210,8 +234,7 @@ class YamlConfigLoader(ConfigLoader):
             )
         
         try:
-            with open(config_path, 'r', encoding='utf-8') as f:
-                data = yaml.safe_load(f)
+            data = yaml.load(config_path.read_bytes(), Loader=_SafeLoader)
             
             if not isinstance(data, dict):
                 raise ConfigurationError(
@@ -424,9 +447,11 @@ class ConfigManager:
         # Create directory if it doesn't exist
         config_path.parent.mkdir(parents=True, exist_ok=True)
         
-        # Save as YAML
-        with open(config_path, 'w', encoding='utf-8') as f:
-            yaml.dump(config.to_dict(), f, default_flow_style=False, indent=2)
+        # Save as YAML: serialize in memory, then write in a single call
+        payload = yaml.dump(
+            config.to_dict(), Dumper=_SafeDumper, default_flow_style=False, indent=2
+        )
+        config_path.write_bytes(payload.encode('utf-8'))
     
     def register_loader(self, loader: ConfigLoader) -> None:
         """
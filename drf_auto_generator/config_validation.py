@@ -1,10 +1,11 @@
 # File: drf_auto_generator/config_validation.py
 from argparse import Namespace
+import asyncio
+import functools
 import logging
-import keyword
-from typing import List, Optional, Dict, Any, Literal, Self
+from typing import List, Optional, Dict, Any, FrozenSet, Literal, Self
 import yaml
-import os
+import secrets
 from pathlib import Path
 
 from pydantic import (
@@ -14,19 +15,45 @@ from pydantic import (
     field_validator,
     model_validator,
     ConfigDict,
+    SecretStr,
 )
 
-from .constants import SupportedDatabases, DefaultConfig
+from .constants import SupportedDatabases, DefaultConfig, FieldNames
 from .exceptions import ConfigurationError
 
 logger = logging.getLogger(__name__)
 
+# Prefer the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # pragma: no cover - depends on the PyYAML build
+    from yaml import SafeLoader as _SafeLoader
+
+# Engine names accepted by DatabaseSettings, as a set for O(1) membership
+_SUPPORTED_ENGINES = frozenset(SupportedDatabases.ALL)
+
+# Hints shown under a validation error, keyed by Pydantic's error type
+_HINT_TABLE: Dict[str, str] = {
+    "missing": "This setting is required.",
+    "literal_error": "Use one of the allowed values listed in the message.",
+    "string_type": "Provide a string value.",
+    "list_type": "Provide a list of table names, e.g. [users, orders].",
+    "int_type": "Provide a whole number.",
+    "int_parsing": "Provide a whole number.",
+    "dict_type": "Provide a mapping of settings.",
+}
+
+# Internal SECRET_KEY used for django.setup(), generated once per process
+_SECRET_KEY_CACHE: Optional[str] = None
+
 # --- Helper Functions for Validation ---
 
 
+# Names repeat heavily across a schema (FK columns, shared column names)
+@functools.lru_cache(maxsize=4096)
 def is_valid_python_identifier(name: str) -> bool:
     """Check if a string is a valid Python identifier and not a keyword."""
-    return name.isidentifier() and not keyword.iskeyword(name)
+    return name.isidentifier() and name not in FieldNames.PYTHON_KEYWORDS
 
 
 # --- Pydantic Models for Configuration Schema ---
@@ -51,6 +78,9 @@ class DatabaseSettings(BaseModel):
         default_factory=dict, description="Database engine specific options."
     )  # Use default_factory
 
+    # Connection settings are read-only once validated
+    model_config = ConfigDict(frozen=True)
+
     def __getitem__(self, key: str) -> Any:
         return getattr(self, key)
 
@@ -58,7 +88,7 @@ class DatabaseSettings(BaseModel):
     @classmethod
     def validate_engine(cls, v: str) -> str:
         """Ensure engine is a valid Django database engine."""
-        if v not in SupportedDatabases.ALL:
+        if v not in _SUPPORTED_ENGINES:
             raise ValueError(f"Database engine: {v} is not supported. Supported engines are: {', '.join(SupportedDatabases.ALL)}")
         return v
 
@@ -71,24 +101,21 @@ class DatabaseSettings(BaseModel):
         """Ensure port is a number or string representation of one, and within range."""
         if v is None or v == "":
             return None
-        port_num: Optional[int] = None
-        if isinstance(v, int):
-            port_num = v
-        elif isinstance(v, str):
+        if isinstance(v, str):
+            # int() alone would also accept signs, whitespace and underscores
             if not v.isdigit():
                 raise ValueError(
                     f"Port must be a number or string containing only digits, got '{v}'"
                 )
-            try:
-                port_num = int(v)
-            except ValueError:
-                raise ValueError(f"Could not convert port '{v}' to a number")
+            port_num = int(v)
+        elif isinstance(v, int):
+            port_num = v
         else:
             raise TypeError(
                 f"Port must be an integer or string containing digits, got {type(v).__name__}"
             )
 
-        if port_num is not None and not 0 <= port_num <= 65535:
+        if not 0 <= port_num <= 65535:
             raise ValueError(f"Port must be between 0 and 65535, got {port_num}")
         return port_num
 
@@ -116,11 +143,12 @@ class ToolConfigSchema(BaseModel):
         min_length=1,
         description="Name for the generated Django app (Python identifier).",
     )
-    include_tables: Optional[List[str]] = Field(
+    # Stored as frozensets: consumers only test table-name membership
+    include_tables: Optional[FrozenSet[str]] = Field(
         default=None,
         description="Optional list of specific table names (strings) to include.",
     )
-    exclude_tables: Optional[List[str]] = Field(
+    exclude_tables: Optional[FrozenSet[str]] = Field(
         default=None, description="Optional list of table names (strings) to exclude."
     )
     auto_include_dependencies: bool = Field(
@@ -154,7 +182,8 @@ class ToolConfigSchema(BaseModel):
     )
 
     # Internal field, usually added by load_config if not provided by user
-    SECRET_KEY: Optional[str] = Field(
+    # SecretStr keeps the key out of repr()/logs; call get_secret_value() to use it
+    SECRET_KEY: Optional[SecretStr] = Field(
         default=None, description="Internal secret key for Django setup."
     )
 
@@ -180,32 +209,40 @@ class ToolConfigSchema(BaseModel):
             )
         return v
 
-    # Use 'each_item=True' to validate items within the list
-    # Use mode='before' to catch non-strings early
+    # One 'before' validator receives the whole list, so items are checked in a
+    # single batch pass rather than one Pydantic dispatch per item
     @field_validator(
         "include_tables", "exclude_tables", mode="before", check_fields=False
     )  # check_fields=False needed for optional fields
     @classmethod
-    def check_table_names_list(cls, v: Optional[List[Any]]) -> Optional[List[str]]:
-        """Ensure items in table lists are non-empty strings."""
+    def check_table_names_list(cls, v: Optional[List[Any]]) -> Optional[FrozenSet[str]]:
+        """Ensure items in table lists are non-empty strings and dedupe them into a frozenset."""
         if v is None:
             return None
-        if not isinstance(v, list):
+        # Sets and frozensets include re-validating a dumped config
+        if not isinstance(v, (list, tuple, set, frozenset)):
             # This might be caught by Pydantic typing, but check defensively
-            raise TypeError("include_tables/exclude_tables must be a list.")
-        processed_list = []
+            raise TypeError(
+                "include_tables/exclude_tables must be a list, tuple or set."
+            )
+        if not isinstance(v, list):
+            v = list(v)
+        # Fast path: one pass that type-checks and strips every item; the
+        # per-item error messages are only built when that pass fails.
+        if all(isinstance(item, str) for item in v):
+            processed = frozenset([item.strip() for item in v])
+            if "" not in processed:
+                return processed
+
         for index, item in enumerate(v):
             if not isinstance(item, str):
                 raise TypeError(
                     f"Item at index {index} must be a string, found: {type(item).__name__}"
                 )
-            stripped_item = item.strip()
-            if not stripped_item:
+            if not item.strip():
                 raise ValueError(
                     f"Item at index {index} cannot be empty or just whitespace."
                 )
-            processed_list.append(stripped_item)
-        return processed_list
 
     # --- Custom Model Validator using @model_validator ---
     # mode='after' runs after field validation and model creation
@@ -236,6 +273,11 @@ class ToolConfigSchema(BaseModel):
     )
 
 
+# Config keys that may be overridden by CLI arguments. Pydantic V2 does not
+# expose fields as class attributes, so look them up in model_fields.
+_CLI_OVERRIDABLE_KEYS = frozenset(ToolConfigSchema.model_fields) - {"databases"}
+
+
 # --- Validation Function ---
 def validate_and_parse_config(config_dict: Dict[str, Any]) -> ToolConfigSchema:
     """
@@ -255,19 +297,22 @@ def validate_and_parse_config(config_dict: Dict[str, Any]) -> ToolConfigSchema:
             "Configuration validation failed! Please check your config file or arguments."
         )
 
-        # Collect all errors
+        # Collect all errors and report them in a single log record
         error_messages = []
+        log_lines = ["Configuration errors:"]
         for error in e.errors():
             loc_parts = [str(loc_item) for loc_item in error.get("loc", ())]
             loc_str = " -> ".join(loc_parts) if loc_parts else "Model Level"
             msg = error.get("msg", "Unknown validation error")
             input_value = error.get("input", "N/A")
 
-            error_msg = f"Location '{loc_str}': {msg}"
-            error_messages.append(error_msg)
+            error_messages.append(f"Location '{loc_str}': {msg}")
+            log_lines.append(f"  - {loc_str}: {msg} (input: {input_value})")
+            hint = _HINT_TABLE.get(error["type"])
+            if hint:
+                log_lines.append(f"    Hint: {hint}")
 
-            # Log detailed error
-            logger.error(f"Validation error at {loc_str}: {msg} (input: {input_value})")
+        logger.error("\n".join(log_lines))
 
         # Raise our custom exception
         raise ConfigurationError(
@@ -302,15 +347,15 @@ def load_config(config_path: Optional[str], cli_args: Namespace) -> ToolConfigSc
         try:
             config_file = Path(config_path)
             if config_file.is_file():
-                with open(config_file, "r", encoding="utf-8") as f:
-                    yaml_config = yaml.safe_load(f)
-                    if yaml_config and isinstance(yaml_config, dict):
-                        raw_config.update(yaml_config)
-                        logger.debug(f"Loaded configuration from {config_path}")
-                    elif yaml_config:
-                        logger.warning(
-                            f"Content in config file {config_path} is not a dictionary. Ignoring file content."
-                        )
+                # Read the file in one go and let the C parser decode it
+                yaml_config = yaml.load(config_file.read_bytes(), Loader=_SafeLoader)
+                if yaml_config and isinstance(yaml_config, dict):
+                    raw_config.update(yaml_config)
+                    logger.debug(f"Loaded configuration from {config_path}")
+                elif yaml_config:
+                    logger.warning(
+                        f"Content in config file {config_path} is not a dictionary. Ignoring file content."
+                    )
             else:
                 logger.warning(
                     f"Config file not found at {config_path}. Using defaults and CLI arguments."
@@ -333,10 +378,8 @@ def load_config(config_path: Optional[str], cli_args: Namespace) -> ToolConfigSc
     overridden_keys = set()
     for key, value in cli_dict.items():
         # Only override if the CLI arg was actually given (is not None)
-        # And don't override 'databases' via simple CLI args for now
-        if (
-            value is not None and key != "databases" and hasattr(ToolConfigSchema, key)
-        ):  # Check if it's a valid config key
+        # and names a valid config key ('databases' is never set from the CLI)
+        if value is not None and key in _CLI_OVERRIDABLE_KEYS:
             raw_config[key] = value
             overridden_keys.add(key)
     if overridden_keys:
@@ -344,7 +387,10 @@ def load_config(config_path: Optional[str], cli_args: Namespace) -> ToolConfigSc
 
     # 3. Add internal SECRET_KEY if not present (needed for django.setup)
     if "SECRET_KEY" not in raw_config:
-        raw_config["SECRET_KEY"] = os.urandom(50).hex()
+        global _SECRET_KEY_CACHE
+        if _SECRET_KEY_CACHE is None:
+            _SECRET_KEY_CACHE = secrets.token_urlsafe(50)
+        raw_config["SECRET_KEY"] = _SECRET_KEY_CACHE
 
     # 4. Validate using the function which uses Pydantic V2 style
     logger.info("Validating final configuration...")
@@ -355,3 +401,16 @@ def load_config(config_path: Optional[str], cli_args: Namespace) -> ToolConfigSc
 
     logger.info("Configuration loaded and validated successfully.")
     return validated_config
+
+
+async def load_config_async(
+    config_path: Optional[str], cli_args: Namespace
+) -> ToolConfigSchema:
+    """
+    Async variant of load_config for callers running an event loop.
+
+    The file read, YAML parse and validation run in a worker thread via
+    asyncio.to_thread, so other coroutines (e.g. fetching a second config or
+    opening a database connection) can proceed meanwhile.
+    """
+    return await asyncio.to_thread(load_config, config_path, cli_args)
@@ -6,7 +6,13 @@ that were previously scattered across the codebase. This improves maintainabilit
 and makes it easier for contributors to modify behavior.
 """
 
-from typing import Dict, Set, List, Any
+import functools
+import keyword
+import re
+import sys
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Dict, FrozenSet, Set, List, Any, Mapping, Optional
 
 
 # =============================================================================
@@ -16,6 +22,8 @@ from typing import Dict, Set, List, Any
 class DefaultConfig:
     """Default configuration values."""
 
+    __slots__ = ()
+
     # Project defaults
     OUTPUT_DIR = "./generated_api_django"
     PROJECT_NAME = "myapi_django"
@@ -35,18 +43,41 @@ class DefaultConfig:
     AUTO_ADD_STR_METHOD = True
 
 
+@dataclass(frozen=True, slots=True)
+class EngineCaps:
+    """Per-engine capability flags used when validating connection settings."""
+
+    display_name: str
+    supported: bool  # Fully supported by the generator
+    file_based: bool  # No user/host/port; NAME is a file path
+    default_port: Optional[int] = None
+
+
 class SupportedDatabases:
     """Supported database engines."""
 
-    POSTGRESQL = 'django.db.backends.postgresql'
-    SQLITE = 'django.db.backends.sqlite3'
-    MYSQL = 'django.db.backends.mysql'
-    ORACLE = 'django.db.backends.oracle'
+    __slots__ = ()
+
+    # Interned: dotted literals are not interned automatically, and engine
+    # names are compared against config values throughout generation
+    POSTGRESQL = sys.intern('django.db.backends.postgresql')
+    SQLITE = sys.intern('django.db.backends.sqlite3')
+    MYSQL = sys.intern('django.db.backends.mysql')
+    ORACLE = sys.intern('django.db.backends.oracle')
+
+    # Engine -> capabilities, so callers need one lookup instead of
+    # scanning ALL/SUPPORTED and comparing engine names
+    ENGINES: Mapping[str, EngineCaps] = MappingProxyType({
+        POSTGRESQL: EngineCaps("PostgreSQL", supported=True, file_based=False, default_port=5432),
+        SQLITE: EngineCaps("SQLite", supported=True, file_based=True),
+        MYSQL: EngineCaps("MySQL", supported=True, file_based=False, default_port=3306),
+        ORACLE: EngineCaps("Oracle", supported=False, file_based=False, default_port=1521),
+    })
 
-    ALL = [POSTGRESQL, SQLITE, MYSQL, ORACLE]
+    ALL = list(ENGINES)
 
     # Currently fully supported
-    SUPPORTED = [POSTGRESQL, SQLITE, MYSQL]
+    SUPPORTED = [engine for engine, caps in ENGINES.items() if caps.supported]
 
 
 # =============================================================================
@@ -56,6 +87,12 @@ class SupportedDatabases:
 class DjangoFieldTypes:
     """Django model field types and their properties."""
 
+    __slots__ = ()
+
+    # Identifier-like literals such as "CharField" are interned by the
+    # compiler, so these need no sys.intern (unlike the dotted engine names
+    # above). Field types read from the database are interned on introspection.
+
     # Auto fields
     AUTO_FIELD = "AutoField"
     BIG_AUTO_FIELD = "BigAutoField"
@@ -95,154 +132,168 @@ class DjangoFieldTypes:
     FILE_PATH_FIELD = "FilePathField"
 
 
-# Database type to Django field mapping
-DJANGO_FIELD_MAP: Dict[str, str] = {
-    # Auto fields
-    DjangoFieldTypes.AUTO_FIELD: DjangoFieldTypes.AUTO_FIELD,
-    DjangoFieldTypes.BIG_AUTO_FIELD: DjangoFieldTypes.BIG_AUTO_FIELD,
-    DjangoFieldTypes.SMALL_AUTO_FIELD: DjangoFieldTypes.SMALL_AUTO_FIELD,
+# Slug values: the string form is emitted in OpenAPI schemas, the compiled
+# pattern is for validating values in-process.
+SLUG_REGEX_STR = r"^[-a-zA-Z0-9_]+$"
+SLUG_REGEX = re.compile(SLUG_REGEX_STR)
 
-    # Numeric fields
-    DjangoFieldTypes.INTEGER_FIELD: DjangoFieldTypes.INTEGER_FIELD,
-    DjangoFieldTypes.BIG_INTEGER_FIELD: DjangoFieldTypes.BIG_INTEGER_FIELD,
-    DjangoFieldTypes.SMALL_INTEGER_FIELD: DjangoFieldTypes.SMALL_INTEGER_FIELD,
-    DjangoFieldTypes.POSITIVE_INTEGER_FIELD: DjangoFieldTypes.POSITIVE_INTEGER_FIELD,
-    DjangoFieldTypes.POSITIVE_BIG_INTEGER_FIELD: DjangoFieldTypes.POSITIVE_BIG_INTEGER_FIELD,
-    DjangoFieldTypes.POSITIVE_SMALL_INTEGER_FIELD: DjangoFieldTypes.POSITIVE_SMALL_INTEGER_FIELD,
-    DjangoFieldTypes.FLOAT_FIELD: DjangoFieldTypes.FLOAT_FIELD,
-    DjangoFieldTypes.DECIMAL_FIELD: DjangoFieldTypes.DECIMAL_FIELD,
 
-    # String fields
-    DjangoFieldTypes.CHAR_FIELD: DjangoFieldTypes.CHAR_FIELD,
-    DjangoFieldTypes.TEXT_FIELD: DjangoFieldTypes.TEXT_FIELD,
-    DjangoFieldTypes.EMAIL_FIELD: DjangoFieldTypes.EMAIL_FIELD,
-    DjangoFieldTypes.URL_FIELD: DjangoFieldTypes.URL_FIELD,
-    DjangoFieldTypes.SLUG_FIELD: DjangoFieldTypes.SLUG_FIELD,
+def is_slug(value: str) -> bool:
+    """Return True if value is a valid Django slug."""
+    return SLUG_REGEX.fullmatch(value) is not None
 
-    # Date/time fields
-    DjangoFieldTypes.DATE_FIELD: DjangoFieldTypes.DATE_FIELD,
-    DjangoFieldTypes.DATE_TIME_FIELD: DjangoFieldTypes.DATE_TIME_FIELD,
-    DjangoFieldTypes.TIME_FIELD: DjangoFieldTypes.TIME_FIELD,
-    DjangoFieldTypes.DURATION_FIELD: DjangoFieldTypes.DURATION_FIELD,
 
-    # Other fields
-    DjangoFieldTypes.BOOLEAN_FIELD: DjangoFieldTypes.BOOLEAN_FIELD,
-    DjangoFieldTypes.UUID_FIELD: DjangoFieldTypes.UUID_FIELD,
-    DjangoFieldTypes.JSON_FIELD: DjangoFieldTypes.JSON_FIELD,
-    DjangoFieldTypes.BINARY_FIELD: DjangoFieldTypes.BINARY_FIELD,
-    DjangoFieldTypes.FILE_FIELD: DjangoFieldTypes.FILE_FIELD,
-    DjangoFieldTypes.IMAGE_FIELD: DjangoFieldTypes.IMAGE_FIELD,
-    DjangoFieldTypes.GENERIC_IP_ADDRESS_FIELD: DjangoFieldTypes.GENERIC_IP_ADDRESS_FIELD,
-    DjangoFieldTypes.FILE_PATH_FIELD: DjangoFieldTypes.FILE_PATH_FIELD,
-}
+# The field/schema maps below are built on first use rather than at import,
+# so importing this module (e.g. for ``--help``) stays cheap. The getters
+# return read-only views shared by all callers.
 
 
-# OpenAPI schema type mappings
-OPENAPI_TYPE_MAP: Dict[str, Dict[str, Any]] = {
-    # Auto fields
-    DjangoFieldTypes.AUTO_FIELD: {"type": "integer", "readOnly": True},
-    DjangoFieldTypes.BIG_AUTO_FIELD: {"type": "integer", "format": "int64", "readOnly": True},
-    DjangoFieldTypes.SMALL_AUTO_FIELD: {"type": "integer", "readOnly": True},
+# Introspection already reports Django field class names, so mapping a DB type
+# is a membership check rather than a lookup.
+DJANGO_FIELD_NAMES: FrozenSet[str] = frozenset(
+    value for name, value in vars(DjangoFieldTypes).items()
+    if not name.startswith("_") and isinstance(value, str)
+)
 
-    # Numeric fields
-    DjangoFieldTypes.INTEGER_FIELD: {"type": "integer"},
-    DjangoFieldTypes.BIG_INTEGER_FIELD: {"type": "integer", "format": "int64"},
-    DjangoFieldTypes.SMALL_INTEGER_FIELD: {"type": "integer"},
-    DjangoFieldTypes.POSITIVE_INTEGER_FIELD: {"type": "integer", "minimum": 0},
-    DjangoFieldTypes.POSITIVE_BIG_INTEGER_FIELD: {"type": "integer", "format": "int64", "minimum": 0},
-    DjangoFieldTypes.POSITIVE_SMALL_INTEGER_FIELD: {"type": "integer", "minimum": 0},
-    DjangoFieldTypes.FLOAT_FIELD: {"type": "number", "format": "float"},
-    DjangoFieldTypes.DECIMAL_FIELD: {"type": "number", "format": "double"},
 
-    # String fields
-    DjangoFieldTypes.CHAR_FIELD: {"type": "string"},
-    DjangoFieldTypes.TEXT_FIELD: {"type": "string"},
-    DjangoFieldTypes.EMAIL_FIELD: {"type": "string", "format": "email"},
-    DjangoFieldTypes.URL_FIELD: {"type": "string", "format": "uri"},
-    DjangoFieldTypes.SLUG_FIELD: {"type": "string", "pattern": r"^[-a-zA-Z0-9_]+$"},
+def map_django_field(db_type: str, default: str = DjangoFieldTypes.TEXT_FIELD) -> str:
+    """Return db_type if it is a known Django field type, otherwise default."""
+    return db_type if db_type in DJANGO_FIELD_NAMES else default
 
-    # Date/time fields
-    DjangoFieldTypes.DATE_FIELD: {"type": "string", "format": "date"},
-    DjangoFieldTypes.DATE_TIME_FIELD: {"type": "string", "format": "date-time"},
-    DjangoFieldTypes.TIME_FIELD: {"type": "string", "format": "time"},
-    DjangoFieldTypes.DURATION_FIELD: {"type": "string", "format": "duration"},
 
-    # Other fields
-    DjangoFieldTypes.BOOLEAN_FIELD: {"type": "boolean"},
-    DjangoFieldTypes.UUID_FIELD: {"type": "string", "format": "uuid"},
-    DjangoFieldTypes.JSON_FIELD: {"type": "object", "additionalProperties": True},
-    DjangoFieldTypes.BINARY_FIELD: {"type": "string", "format": "byte"},
-    DjangoFieldTypes.FILE_FIELD: {"type": "string", "format": "uri", "readOnly": True},
-    DjangoFieldTypes.IMAGE_FIELD: {"type": "string", "format": "uri", "readOnly": True},
-    DjangoFieldTypes.GENERIC_IP_ADDRESS_FIELD: {"type": "string", "format": "ipv4 or ipv6"},
-
-    # Fallback
-    "Unknown": {"type": "string", "description": "Type mapping fallback."}
+@functools.cache
+def get_django_field_map() -> Mapping[str, str]:
+    """Database type to Django field mapping (prefer map_django_field for lookups)."""
+    return MappingProxyType({name: map_django_field(name) for name in DJANGO_FIELD_NAMES})
+
+
+@functools.cache
+def get_openapi_type_map() -> Mapping[str, Dict[str, Any]]:
+    """OpenAPI schema type mappings (copy an entry before modifying it)."""
+    return MappingProxyType({
+        # Auto fields
+        DjangoFieldTypes.AUTO_FIELD: {"type": "integer", "readOnly": True},
+        DjangoFieldTypes.BIG_AUTO_FIELD: {"type": "integer", "format": "int64", "readOnly": True},
+        DjangoFieldTypes.SMALL_AUTO_FIELD: {"type": "integer", "readOnly": True},
+
+        # Numeric fields
+        DjangoFieldTypes.INTEGER_FIELD: {"type": "integer"},
+        DjangoFieldTypes.BIG_INTEGER_FIELD: {"type": "integer", "format": "int64"},
+        DjangoFieldTypes.SMALL_INTEGER_FIELD: {"type": "integer"},
+        DjangoFieldTypes.POSITIVE_INTEGER_FIELD: {"type": "integer", "minimum": 0},
+        DjangoFieldTypes.POSITIVE_BIG_INTEGER_FIELD: {"type": "integer", "format": "int64", "minimum": 0},
+        DjangoFieldTypes.POSITIVE_SMALL_INTEGER_FIELD: {"type": "integer", "minimum": 0},
+        DjangoFieldTypes.FLOAT_FIELD: {"type": "number", "format": "float"},
+        DjangoFieldTypes.DECIMAL_FIELD: {"type": "number", "format": "double"},
+
+        # String fields
+        DjangoFieldTypes.CHAR_FIELD: {"type": "string"},
+        DjangoFieldTypes.TEXT_FIELD: {"type": "string"},
+        DjangoFieldTypes.EMAIL_FIELD: {"type": "string", "format": "email"},
+        DjangoFieldTypes.URL_FIELD: {"type": "string", "format": "uri"},
+        DjangoFieldTypes.SLUG_FIELD: {"type": "string", "pattern": SLUG_REGEX_STR},
+
+        # Date/time fields
+        DjangoFieldTypes.DATE_FIELD: {"type": "string", "format": "date"},
+        DjangoFieldTypes.DATE_TIME_FIELD: {"type": "string", "format": "date-time"},
+        DjangoFieldTypes.TIME_FIELD: {"type": "string", "format": "time"},
+        DjangoFieldTypes.DURATION_FIELD: {"type": "string", "format": "duration"},
+
+        # Other fields
+        DjangoFieldTypes.BOOLEAN_FIELD: {"type": "boolean"},
+        DjangoFieldTypes.UUID_FIELD: {"type": "string", "format": "uuid"},
+        DjangoFieldTypes.JSON_FIELD: {"type": "object", "additionalProperties": True},
+        DjangoFieldTypes.BINARY_FIELD: {"type": "string", "format": "byte"},
+        DjangoFieldTypes.FILE_FIELD: {"type": "string", "format": "uri", "readOnly": True},
+        DjangoFieldTypes.IMAGE_FIELD: {"type": "string", "format": "uri", "readOnly": True},
+        DjangoFieldTypes.GENERIC_IP_ADDRESS_FIELD: {"type": "string", "format": "ipv4 or ipv6"},
+
+        # Fallback
+        "Unknown": {"type": "string", "description": "Type mapping fallback."}
+    })
+
+
+_LAZY_MAPS = {
+    "DJANGO_FIELD_MAP": get_django_field_map,
+    "OPENAPI_TYPE_MAP": get_openapi_type_map,
 }
 
 
+def __getattr__(name: str) -> Any:
+    """Keep the DJANGO_FIELD_MAP and OPENAPI_TYPE_MAP names importable (PEP 562)."""
+    if name in _LAZY_MAPS:
+        return _LAZY_MAPS[name]()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 # =============================================================================
 # FIELD CATEGORIES
 # =============================================================================
 
 class FieldCategories:
-    """Categorized field types for different operations."""
+    """
+    Categorized field types for different operations.
+
+    Categories are frozensets since they are only used for membership tests.
+    """
+
+    __slots__ = ()
 
     # Field option categories
-    BOOLEAN_OPTIONS: Set[str] = {"primary_key", "unique", "null", "blank"}
-    NUMERIC_OPTIONS: Set[str] = {"max_length", "max_digits", "decimal_places"}
-    STRING_OPTIONS: Set[str] = {"max_length", "choices"}
+    BOOLEAN_OPTIONS: FrozenSet[str] = frozenset({"primary_key", "unique", "null", "blank"})
+    NUMERIC_OPTIONS: FrozenSet[str] = frozenset({"max_length", "max_digits", "decimal_places"})
+    STRING_OPTIONS: FrozenSet[str] = frozenset({"max_length", "choices"})
 
     # Searchable field types (for Django admin and filters)
-    SEARCHABLE_TYPES: List[str] = [
+    SEARCHABLE_TYPES: FrozenSet[str] = frozenset({
         DjangoFieldTypes.CHAR_FIELD,
         DjangoFieldTypes.TEXT_FIELD,
         DjangoFieldTypes.EMAIL_FIELD
-    ]
+    })
 
     # Display-friendly field types (for admin list_display)
-    DISPLAY_TYPES: List[str] = [
+    DISPLAY_TYPES: FrozenSet[str] = frozenset({
         DjangoFieldTypes.CHAR_FIELD,
         DjangoFieldTypes.TEXT_FIELD,
         DjangoFieldTypes.EMAIL_FIELD,
         DjangoFieldTypes.URL_FIELD
-    ]
+    })
 
     # Filterable field types (for admin list_filter)
-    FILTER_TYPES: List[str] = [
+    FILTER_TYPES: FrozenSet[str] = frozenset({
         DjangoFieldTypes.BOOLEAN_FIELD,
         DjangoFieldTypes.DATE_FIELD,
         DjangoFieldTypes.DATE_TIME_FIELD,
         DjangoFieldTypes.INTEGER_FIELD,
         DjangoFieldTypes.FLOAT_FIELD,
         DjangoFieldTypes.DECIMAL_FIELD
-    ]
+    })
 
     # Integer field types
-    INTEGER_TYPES: List[str] = [
+    INTEGER_TYPES: FrozenSet[str] = frozenset({
         DjangoFieldTypes.INTEGER_FIELD,
         DjangoFieldTypes.BIG_INTEGER_FIELD,
         DjangoFieldTypes.SMALL_INTEGER_FIELD,
         DjangoFieldTypes.POSITIVE_INTEGER_FIELD,
         DjangoFieldTypes.POSITIVE_BIG_INTEGER_FIELD,
         DjangoFieldTypes.POSITIVE_SMALL_INTEGER_FIELD
-    ]
+    })
 
     # Date/time field types
-    DATE_TIME_TYPES: List[str] = [
+    DATE_TIME_TYPES: FrozenSet[str] = frozenset({
         DjangoFieldTypes.DATE_FIELD,
         DjangoFieldTypes.DATE_TIME_FIELD,
         DjangoFieldTypes.TIME_FIELD
-    ]
+    })
 
     # Text field types
-    TEXT_TYPES: List[str] = [
+    TEXT_TYPES: FrozenSet[str] = frozenset({
         DjangoFieldTypes.CHAR_FIELD,
         DjangoFieldTypes.TEXT_FIELD,
         DjangoFieldTypes.EMAIL_FIELD,
         DjangoFieldTypes.URL_FIELD,
         DjangoFieldTypes.SLUG_FIELD
-    ]
+    })
 
 
 # =============================================================================
@@ -252,6 +303,8 @@ class FieldCategories:
 class FieldNames:
     """Common field names and patterns."""
 
+    __slots__ = ()
+
     # Common descriptive field names for __str__ method
     DESCRIPTIVE_NAMES: List[str] = [
         'name', 'title', 'username', 'email', 'description', 'label', 'slug'
@@ -268,14 +321,9 @@ class FieldNames:
         'name', 'title', 'email', 'username', 'code', 'status'
     ]
 
-    # Reserved Python keywords (for field name validation)
-    PYTHON_KEYWORDS: Set[str] = {
-        "False", "None", "True", "and", "as", "assert", "async", "await",
-        "break", "class", "continue", "def", "del", "elif", "else", "except",
-        "finally", "for", "from", "global", "if", "import", "in", "is",
-        "lambda", "nonlocal", "not", "or", "pass", "raise", "return", "try",
-        "while", "with", "yield"
-    }
+    # Reserved Python keywords (for field name validation). Soft keywords
+    # (match, case, type, _) are valid identifiers and are deliberately left out.
+    PYTHON_KEYWORDS: FrozenSet[str] = frozenset(keyword.kwlist)
 
 
 # =============================================================================
@@ -285,6 +333,8 @@ class FieldNames:
 class HTTPResponses:
     """Standard HTTP response codes and descriptions."""
 
+    __slots__ = ()
+
     SUCCESS_CODES = {
         200: "OK",
         201: "Created",
@@ -305,15 +355,22 @@ class HTTPResponses:
         503: "Service Unavailable"
     }
 
+    # Merged once at class creation; read-only since it is shared.
+    ALL_CODES: Mapping[int, str] = MappingProxyType(
+        {**SUCCESS_CODES, **CLIENT_ERROR_CODES, **SERVER_ERROR_CODES}
+    )
+
     @classmethod
-    def get_all_codes(cls) -> Dict[int, str]:
+    def get_all_codes(cls) -> Mapping[int, str]:
         """Get all HTTP response codes."""
-        return {**cls.SUCCESS_CODES, **cls.CLIENT_ERROR_CODES, **cls.SERVER_ERROR_CODES}
+        return cls.ALL_CODES
 
 
 class URLPatterns:
     """URL pattern constants."""
 
+    __slots__ = ()
+
     ROOT = "/"
     EMPTY = ""
     ADMIN = "admin/"
@@ -331,6 +388,8 @@ class URLPatterns:
 class PackageVersions:
     """Required package versions."""
 
+    __slots__ = ()
+
     # Core dependencies
     DJANGO = ">= 5.2"
     DJANGORESTFRAMEWORK = ">= 3.16.0"
@@ -367,6 +426,8 @@ class PackageVersions:
 class FileExtensions:
     """Common file extensions."""
 
+    __slots__ = ()
+
     PYTHON = ".py"
     YAML = ".yaml"
     JSON = ".json"
@@ -378,6 +439,8 @@ class FileExtensions:
 class RelationshipDefaults:
     """Default values for relationships."""
 
+    __slots__ = ()
+
     ON_DELETE_CASCADE = "CASCADE"
     ON_DELETE_PROTECT = "PROTECT"
     ON_DELETE_SET_NULL = "SET_NULL"
@@ -391,6 +454,8 @@ class RelationshipDefaults:
 class GenerationOptions:
     """Code generation options."""
 
+    __slots__ = ()
+
     DEFAULT_INDENT = "    "  # 4 spaces
     DEFAULT_LINE_LENGTH = 88  # Black default
 
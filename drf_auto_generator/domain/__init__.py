@@ -6,46 +6,66 @@ infrastructure concerns. These models represent the essential concepts
 of the code generation domain.
 """
 
-from .models import (
-    ColumnInfo,
-    TableInfo, 
-    FieldMapping,
-    RelationshipInfo,
-    RelationshipType,
-    FieldType,
-    ConstraintInfo,
-    GenerationContext,
-    GenerationResult
-)
+import importlib
+from typing import Any
 
-from .field_mapping import (
-    FieldMapper,
-    FieldMapperProtocol,
-    BaseFieldMapper
-)
+# Submodules are imported on first attribute access (PEP 562) so that using
+# one symbol does not load every submodule (naming pulls in inflect, which
+# is slow to import).
+_LAZY = {
+    # Core models
+    'ColumnInfo': '.models',
+    'TableInfo': '.models',
+    'FieldMapping': '.models',
+    'RelationshipInfo': '.models',
+    'RelationshipType': '.models',
+    'FieldType': '.models',
+    'ConstraintInfo': '.models',
+    'GenerationContext': '.models',
+    'GenerationResult': '.models',
+
+    # Field mapping
+    'FieldMapper': '.field_mapping',
+    'FieldMapperProtocol': '.field_mapping',
+    'BaseFieldMapper': '.field_mapping',
+    'DjangoFieldOptions': '.field_mapping',
+
+    # Relationships
+    'RelationshipAnalyzer': '.relationships',
+    'RelationshipResolver': '.relationships',
+
+    # Constraints
+    'ConstraintAnalyzer': '.constraints',
+    'ConstraintType': '.constraints',
+    'IndexInfo': '.constraints',
+    'UniqueConstraint': '.constraints',
+
+    # Naming
+    'NamingConventions': '.naming',
+    'to_snake_case': '.naming',
+    'to_pascal_case': '.naming',
+    'clean_field_name': '.naming',
+    'generate_model_name': '.naming',
+    'generate_relationship_name': '.naming',
+    'generate_related_name': '.naming',
+    'validate_python_identifier': '.naming',
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import the submodule defining ``name`` and cache the attribute."""
+    try:
+        module_name = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
 
-from .relationships import (
-    RelationshipAnalyzer,
-    RelationshipResolver
-)
 
-from .constraints import (
-    ConstraintAnalyzer,
-    ConstraintType,
-    IndexInfo,
-    UniqueConstraint
-)
+def __dir__() -> list:
+    return sorted(set(globals()) | set(_LAZY))
 
-from .naming import (
-    NamingConventions,
-    to_snake_case,
-    to_pascal_case, 
-    clean_field_name,
-    generate_model_name,
-    generate_relationship_name,
-    generate_related_name,
-    validate_python_identifier
-)
 
 __all__ = [
     # Core models
@@ -63,6 +83,7 @@ __all__ = [
     'FieldMapper',
     'FieldMapperProtocol',
     'BaseFieldMapper',
+    'DjangoFieldOptions',
     
     # Relationships
     'RelationshipAnalyzer',
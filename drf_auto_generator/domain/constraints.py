@@ -5,11 +5,12 @@ This module contains the core business logic for analyzing and processing
 database constraints for Django model generation.
 """
 
-from dataclasses import dataclass
-from typing import List, Dict, Set, Optional, Any
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import List, Dict, Set, FrozenSet, Optional, Any, Tuple, Callable, Iterator, Sequence
 from enum import Enum
 
-from drf_auto_generator.domain.models import TableInfo, ConstraintInfo
+from drf_auto_generator.domain.models import TableInfo, ColumnInfo, ConstraintInfo
 
 
 class ConstraintType(Enum):
@@ -24,7 +25,7 @@ class ConstraintType(Enum):
     TRIGGER = "trigger"
 
 
-@dataclass
+@dataclass(slots=True)
 class IndexInfo:
     """Information about a database index."""
 
@@ -34,20 +35,25 @@ class IndexInfo:
     is_partial: bool = False
     condition: Optional[str] = None
     method: Optional[str] = None  # btree, hash, gin, gist, etc.
+    _cached_dict: Optional[Dict[str, Any]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary representation."""
-        return {
-            'name': self.name,
-            'columns': self.columns,
-            'is_unique': self.is_unique,
-            'is_partial': self.is_partial,
-            'condition': self.condition,
-            'method': self.method
-        }
+        """Convert to dictionary representation (callers get their own copy)."""
+        if self._cached_dict is None:
+            self._cached_dict = {
+                'name': self.name,
+                'columns': self.columns,
+                'is_unique': self.is_unique,
+                'is_partial': self.is_partial,
+                'condition': self.condition,
+                'method': self.method
+            }
+        return dict(self._cached_dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class UniqueConstraint:
     """Information about a unique constraint."""
 
@@ -56,16 +62,73 @@ class UniqueConstraint:
     condition: Optional[str] = None
     deferrable: bool = False
     initially_deferred: bool = False
+    _cached_dict: Optional[Dict[str, Any]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary representation."""
+        """Convert to dictionary representation (callers get their own copy)."""
+        if self._cached_dict is None:
+            self._cached_dict = {
+                'name': self.name,
+                'columns': self.columns,
+                'condition': self.condition,
+                'deferrable': self.deferrable,
+                'initially_deferred': self.initially_deferred
+            }
+        return dict(self._cached_dict)
+
+
+@dataclass(slots=True)
+class RawConstraint:
+    """A raw introspected constraint, normalized once for analysis."""
+
+    name: str
+    unique: bool = False
+    check: bool = False
+    columns: List[str] = field(default_factory=list)
+    definition: Optional[str] = ''
+
+    @classmethod
+    def from_dict(cls, name: str, data: Dict[str, Any]) -> 'RawConstraint':
+        """Create from a Django introspection constraint dict."""
+        return cls(
+            name=name,
+            unique=bool(data.get('unique')),
+            check=bool(data.get('check')),
+            columns=data.get('columns', []),
+            definition=data.get('definition', '')
+        )
+
+
+def _unique_to_django(constraint: ConstraintInfo) -> Optional[Dict[str, Any]]:
+    """Build a UniqueConstraint definition for multi-column unique constraints."""
+    # Single column unique constraints are handled by field options
+    if len(constraint.columns) > 1:
+        return {
+            'type': 'UniqueConstraint',
+            'fields': constraint.columns,
+            'name': constraint.name
+        }
+    return None
+
+
+def _check_to_django(constraint: ConstraintInfo) -> Optional[Dict[str, Any]]:
+    """Build a CheckConstraint definition for check constraints with a condition."""
+    if constraint.definition:
         return {
-            'name': self.name,
-            'columns': self.columns,
-            'condition': self.condition,
-            'deferrable': self.deferrable,
-            'initially_deferred': self.initially_deferred
+            'type': 'CheckConstraint',
+            'check': constraint.definition,
+            'name': constraint.name
         }
+    return None
+
+
+# Constraint type -> converter to a Django Meta constraint definition
+_DJANGO_CONSTRAINT_CONVERTERS: Dict[str, Callable[[ConstraintInfo], Optional[Dict[str, Any]]]] = {
+    "unique": _unique_to_django,
+    "check": _check_to_django,
+}
 
 
 class ConstraintAnalyzer:
@@ -79,9 +142,26 @@ class ConstraintAnalyzer:
     def __init__(self):
         """Initialize constraint analyzer."""
         self.analyzed_tables: Set[str] = set()
-        self.constraint_cache: Dict[str, List[ConstraintInfo]] = {}
+        # Cache entries are tuples so cached results cannot be mutated by callers
+        self.constraint_cache: Dict[str, Tuple[ConstraintInfo, ...]] = {}
+        self.django_constraint_cache: Dict[str, Tuple[Dict[str, Any], ...]] = {}
+        self.index_cache: Dict[str, Tuple[IndexInfo, ...]] = {}
+        self.unique_cache: Dict[str, Tuple[UniqueConstraint, ...]] = {}
+
+    def invalidate(self, table_name: str) -> None:
+        """
+        Drop all cached results for a table so the next call re-analyzes it.
 
-    def analyze_table_constraints(self, table: TableInfo) -> List[ConstraintInfo]:
+        Args:
+            table_name: Name of the table whose cached results to drop
+        """
+        self.constraint_cache.pop(table_name, None)
+        self.django_constraint_cache.pop(table_name, None)
+        self.index_cache.pop(table_name, None)
+        self.unique_cache.pop(table_name, None)
+        self.analyzed_tables.discard(table_name)
+
+    def analyze_table_constraints(self, table: TableInfo) -> Tuple[ConstraintInfo, ...]:
         """
         Analyze constraints for a single table.
 
@@ -89,41 +169,89 @@ class ConstraintAnalyzer:
             table: Table to analyze
 
         Returns:
-            List of constraint information
+            Tuple of constraint information
         """
         if table.name in self.constraint_cache:
             return self.constraint_cache[table.name]
 
-        constraints = []
+        constraints = tuple(self._iter_table_constraints(table))
+
+        # Cache results
+        self.constraint_cache[table.name] = constraints
+        self.analyzed_tables.add(table.name)
 
-        # Analyze primary key constraints
-        pk_constraints = self._analyze_primary_key_constraints(table)
-        constraints.extend(pk_constraints)
+        return constraints
 
-        # Analyze unique constraints
-        unique_constraints = self._analyze_unique_constraints(table)
-        constraints.extend(unique_constraints)
+    def iter_constraints_with_django(
+        self, table: TableInfo
+    ) -> Iterator[Tuple[ConstraintInfo, Optional[Dict[str, Any]]]]:
+        """
+        Yield each constraint of a table together with its Django definition.
 
-        # Analyze foreign key constraints
-        fk_constraints = self._analyze_foreign_key_constraints(table)
-        constraints.extend(fk_constraints)
+        Analysis and conversion happen in the same pass. The analysis result
+        is cached once the iterator has been fully consumed.
 
-        # Analyze check constraints
-        check_constraints = self._analyze_check_constraints(table)
-        constraints.extend(check_constraints)
+        Args:
+            table: Table to analyze
 
-        # Analyze indexes
-        index_constraints = self._analyze_indexes(table)
-        constraints.extend(index_constraints)
+        Yields:
+            (constraint, Django Meta constraint definition or None) pairs
+        """
+        cached = self.constraint_cache.get(table.name)
+        if cached is not None:
+            for constraint in cached:
+                yield constraint, self._convert_to_django_constraint(constraint)
+            return
 
-        # Cache results
-        self.constraint_cache[table.name] = constraints
-        self.analyzed_tables.add(table.name)
+        constraints = []
+        for constraint in self._iter_table_constraints(table):
+            constraints.append(constraint)
+            yield constraint, self._convert_to_django_constraint(constraint)
 
-        return constraints
+        self.constraint_cache[table.name] = tuple(constraints)
+        self.analyzed_tables.add(table.name)
 
-    def _analyze_primary_key_constraints(self, table: TableInfo) -> List[ConstraintInfo]:
-        """Analyze primary key constraints."""
+    def _iter_table_constraints(self, table: TableInfo) -> Iterator[ConstraintInfo]:
+        """Analyze a table's constraints in order: PK, unique, FK, check, index."""
+        # Walk columns and raw constraints once, then build each kind from its bucket
+        unique_columns, fk_columns = self._bucket_columns(table)
+        multi_unique, checks = self._bucket_raw_constraints(table)
+
+        yield from self._build_primary_key_constraints(table)
+        yield from self._build_unique_constraints(table, unique_columns, multi_unique)
+        yield from self._build_foreign_key_constraints(table, fk_columns)
+        yield from self._build_check_constraints(checks)
+        yield from self._analyze_indexes(table)
+
+    @staticmethod
+    def _bucket_columns(table: TableInfo) -> Tuple[List[ColumnInfo], List[ColumnInfo]]:
+        """Split columns into (single-column unique, foreign key) in one pass."""
+        unique_columns = []
+        fk_columns = []
+        for column in table.columns:
+            if column.is_unique and not column.is_pk:
+                unique_columns.append(column)
+            if column.is_foreign_key and column.foreign_key_to:
+                fk_columns.append(column)
+        return unique_columns, fk_columns
+
+    @staticmethod
+    def _bucket_raw_constraints(
+        table: TableInfo
+    ) -> Tuple[List[RawConstraint], List[RawConstraint]]:
+        """Split raw constraints into (multi-column unique, check) in one pass."""
+        multi_unique = []
+        checks = []
+        for constraint_name, constraint_data in table.raw_constraints.items():
+            raw = RawConstraint.from_dict(constraint_name, constraint_data)
+            if raw.unique and len(raw.columns) > 1:
+                multi_unique.append(raw)
+            if raw.check:
+                checks.append(raw)
+        return multi_unique, checks
+
+    def _build_primary_key_constraints(self, table: TableInfo) -> List[ConstraintInfo]:
+        """Build the primary key constraint, if any."""
         constraints = []
 
         if table.has_primary_key:
@@ -136,74 +264,104 @@ class ConstraintAnalyzer:
 
         return constraints
 
-    def _analyze_unique_constraints(self, table: TableInfo) -> List[ConstraintInfo]:
-        """Analyze unique constraints."""
+    def _build_unique_constraints(
+        self,
+        table: TableInfo,
+        unique_columns: List[ColumnInfo],
+        multi_unique: List[RawConstraint]
+    ) -> List[ConstraintInfo]:
+        """Build unique constraints from bucketed columns and raw constraints."""
         constraints = []
 
-        # Single column unique constraints
-        for column in table.columns:
-            if column.is_unique and not column.is_pk:
-                constraint = ConstraintInfo(
-                    name=f"{table.name}_{column.name}_unique",
-                    constraint_type="unique",
-                    columns=[column.name]
-                )
-                constraints.append(constraint)
+        # Single column unique constraints; the name prefix is shared per table
+        name_prefix = f"{table.name}_"
+        for column in unique_columns:
+            constraint = ConstraintInfo(
+                name=f"{name_prefix}{column.name}_unique",
+                constraint_type="unique",
+                columns=[column.name]
+            )
+            constraints.append(constraint)
 
         # Multi-column unique constraints from raw constraints
-        for constraint_name, constraint_data in table.raw_constraints.items():
-            if constraint_data.get('unique') and len(constraint_data.get('columns', [])) > 1:
-                constraint = ConstraintInfo(
-                    name=constraint_name,
-                    constraint_type="unique",
-                    columns=constraint_data['columns']
-                )
-                constraints.append(constraint)
+        for raw in multi_unique:
+            constraint = ConstraintInfo(
+                name=raw.name,
+                constraint_type="unique",
+                columns=raw.columns
+            )
+            constraints.append(constraint)
 
         return constraints
 
-    def _analyze_foreign_key_constraints(self, table: TableInfo) -> List[ConstraintInfo]:
-        """Analyze foreign key constraints."""
+    def _build_foreign_key_constraints(
+        self, table: TableInfo, fk_columns: List[ColumnInfo]
+    ) -> List[ConstraintInfo]:
+        """Build foreign key constraints from bucketed columns."""
         constraints = []
 
-        for column in table.columns:
-            if column.is_foreign_key and column.foreign_key_to:
-                target_table, target_column = column.foreign_key_to
-                constraint = ConstraintInfo(
-                    name=f"{table.name}_{column.name}_fkey",
-                    constraint_type="foreign_key",
-                    columns=[column.name],
-                    definition=f"FOREIGN KEY ({column.name}) REFERENCES {target_table}({target_column})"
-                )
-                constraints.append(constraint)
+        name_prefix = f"{table.name}_"
+        for column in fk_columns:
+            target_table, target_column = column.foreign_key_to
+            constraint = ConstraintInfo(
+                name=f"{name_prefix}{column.name}_fkey",
+                constraint_type="foreign_key",
+                columns=[column.name],
+                definition=f"FOREIGN KEY ({column.name}) REFERENCES {target_table}({target_column})"
+            )
+            constraints.append(constraint)
 
         return constraints
 
-    def _analyze_check_constraints(self, table: TableInfo) -> List[ConstraintInfo]:
-        """Analyze check constraints."""
+    def _build_check_constraints(
+        self, checks: List[RawConstraint]
+    ) -> List[ConstraintInfo]:
+        """Build check constraints from bucketed raw constraints."""
         constraints = []
 
-        # Check constraints from raw constraints
-        for constraint_name, constraint_data in table.raw_constraints.items():
-            if constraint_data.get('check'):
-                constraint = ConstraintInfo(
-                    name=constraint_name,
-                    constraint_type="check",
-                    columns=constraint_data.get('columns', []),
-                    definition=constraint_data.get('definition', '')
-                )
-                constraints.append(constraint)
+        for raw in checks:
+            constraint = ConstraintInfo(
+                name=raw.name,
+                constraint_type="check",
+                columns=raw.columns,
+                definition=raw.definition
+            )
+            constraints.append(constraint)
 
         return constraints
 
+    # The _analyze_* methods below analyze one constraint kind on their own;
+    # analyze_table_constraints uses the bucketed builders directly.
+
+    def _analyze_primary_key_constraints(self, table: TableInfo) -> List[ConstraintInfo]:
+        """Analyze primary key constraints."""
+        return self._build_primary_key_constraints(table)
+
+    def _analyze_unique_constraints(self, table: TableInfo) -> List[ConstraintInfo]:
+        """Analyze unique constraints."""
+        unique_columns, _ = self._bucket_columns(table)
+        multi_unique, _ = self._bucket_raw_constraints(table)
+        return self._build_unique_constraints(table, unique_columns, multi_unique)
+
+    def _analyze_foreign_key_constraints(self, table: TableInfo) -> List[ConstraintInfo]:
+        """Analyze foreign key constraints."""
+        _, fk_columns = self._bucket_columns(table)
+        return self._build_foreign_key_constraints(table, fk_columns)
+
+    def _analyze_check_constraints(self, table: TableInfo) -> List[ConstraintInfo]:
+        """Analyze check constraints."""
+        _, checks = self._bucket_raw_constraints(table)
+        return self._build_check_constraints(checks)
+
     def _analyze_indexes(self, table: TableInfo) -> List[ConstraintInfo]:
         """Analyze indexes."""
         constraints = []
 
         # Convert meta_indexes to constraint info
+        default_name = f"{table.name}_idx"
         for index_data in table.meta_indexes:
             constraint = ConstraintInfo(
-                name=index_data.get('name', f"{table.name}_idx"),
+                name=index_data.get('name', default_name),
                 constraint_type="index",
                 columns=index_data.get('fields', []),
                 is_unique_index=index_data.get('unique', False),
@@ -213,7 +371,7 @@ class ConstraintAnalyzer:
 
         return constraints
 
-    def generate_django_constraints(self, table: TableInfo) -> List[Dict[str, Any]]:
+    def generate_django_constraints(self, table: TableInfo) -> Tuple[Dict[str, Any], ...]:
         """
         Generate Django model Meta constraints from analyzed constraints.
 
@@ -221,39 +379,28 @@ class ConstraintAnalyzer:
             table: Table information
 
         Returns:
-            List of Django constraint definitions
+            Tuple of Django constraint definitions
         """
-        constraints = self.analyze_table_constraints(table)
-        django_constraints = []
+        if table.name in self.django_constraint_cache:
+            return self.django_constraint_cache[table.name]
 
-        for constraint in constraints:
-            django_constraint = self._convert_to_django_constraint(constraint)
-            if django_constraint:
-                django_constraints.append(django_constraint)
+        django_constraints = tuple(
+            django_constraint
+            for _, django_constraint in self.iter_constraints_with_django(table)
+            if django_constraint
+        )
 
+        self.django_constraint_cache[table.name] = django_constraints
         return django_constraints
 
     def _convert_to_django_constraint(self, constraint: ConstraintInfo) -> Optional[Dict[str, Any]]:
         """Convert constraint to Django constraint definition."""
-        if constraint.constraint_type == "unique" and len(constraint.columns) > 1:
-            return {
-                'type': 'UniqueConstraint',
-                'fields': constraint.columns,
-                'name': constraint.name
-            }
+        # Primary key and foreign key constraints are handled by field definitions,
+        # so most constraints stop at this single lookup
+        converter = _DJANGO_CONSTRAINT_CONVERTERS.get(constraint.constraint_type)
+        return converter(constraint) if converter else None
 
-        elif constraint.constraint_type == "check" and constraint.definition:
-            return {
-                'type': 'CheckConstraint',
-                'check': constraint.definition,
-                'name': constraint.name
-            }
-
-        # Primary key and foreign key constraints are handled by field definitions
-        # Single column unique constraints are handled by field options
-        return None
-
-    def get_table_indexes(self, table: TableInfo) -> List[IndexInfo]:
+    def get_table_indexes(self, table: TableInfo) -> Tuple[IndexInfo, ...]:
         """
         Get index information for a table.
 
@@ -261,14 +408,18 @@ class ConstraintAnalyzer:
             table: Table information
 
         Returns:
-            List of index information
+            Tuple of index information
         """
+        if table.name in self.index_cache:
+            return self.index_cache[table.name]
+
         indexes = []
 
         # Convert meta_indexes to IndexInfo objects
+        default_name = f"{table.name}_idx"
         for index_data in table.meta_indexes:
             index = IndexInfo(
-                name=index_data.get('name', f"{table.name}_idx"),
+                name=index_data.get('name', default_name),
                 columns=index_data.get('fields', []),
                 is_unique=index_data.get('unique', False),
                 is_partial=bool(index_data.get('condition')),
@@ -277,9 +428,11 @@ class ConstraintAnalyzer:
             )
             indexes.append(index)
 
+        indexes = tuple(indexes)
+        self.index_cache[table.name] = indexes
         return indexes
 
-    def get_unique_constraints(self, table: TableInfo) -> List[UniqueConstraint]:
+    def get_unique_constraints(self, table: TableInfo) -> Tuple[UniqueConstraint, ...]:
         """
         Get unique constraint information for a table.
 
@@ -287,8 +440,11 @@ class ConstraintAnalyzer:
             table: Table information
 
         Returns:
-            List of unique constraint information
+            Tuple of unique constraint information
         """
+        if table.name in self.unique_cache:
+            return self.unique_cache[table.name]
+
         unique_constraints = []
 
         # Analyze constraints to find unique constraints
@@ -304,31 +460,31 @@ class ConstraintAnalyzer:
                 )
                 unique_constraints.append(unique_constraint)
 
+        unique_constraints = tuple(unique_constraints)
+        self.unique_cache[table.name] = unique_constraints
         return unique_constraints
 
-    def optimize_constraints(self, constraints: List[ConstraintInfo]) -> List[ConstraintInfo]:
+    def optimize_constraints(self, constraints: Sequence[ConstraintInfo]) -> List[ConstraintInfo]:
         """
         Optimize constraint definitions by removing redundant constraints.
 
         Args:
-            constraints: List of constraints to optimize
+            constraints: Sequence of constraints to optimize
 
         Returns:
             Optimized list of constraints
         """
         optimized = []
-        seen_constraints = set()
+        # Bucket seen keys by constraint type; column order does not matter
+        # for equality, so a frozenset avoids sorting each column list
+        seen_by_type: Dict[str, Set[Tuple[FrozenSet[str], Optional[str]]]] = defaultdict(set)
 
         for constraint in constraints:
-            # Create a key for deduplication
-            key = (
-                constraint.constraint_type,
-                tuple(sorted(constraint.columns)),
-                constraint.definition
-            )
+            key = (frozenset(constraint.columns), constraint.definition)
+            seen = seen_by_type[constraint.constraint_type]
 
-            if key not in seen_constraints:
-                seen_constraints.add(key)
+            if key not in seen:
+                seen.add(key)
                 optimized.append(constraint)
 
         return optimized
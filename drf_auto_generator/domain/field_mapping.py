@@ -5,12 +5,160 @@ This module contains the core business logic for mapping database fields
 to Django model fields, OpenAPI schemas, and DRF serializer fields.
 """
 
+import functools
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Protocol
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional, Protocol, Tuple
 
 from .models import ColumnInfo, FieldMapping, FieldType
 
 
+# Static lookup tables, built once at import instead of on every column.
+# Schemas are read-only; callers get a copy via dict(...).
+_DJANGO_FIELD_TYPES: Mapping[FieldType, str] = MappingProxyType({
+    FieldType.AUTO: "AutoField",
+    FieldType.INTEGER: "IntegerField",
+    FieldType.FLOAT: "FloatField",
+    FieldType.DECIMAL: "DecimalField",
+    FieldType.STRING: "CharField",
+    FieldType.TEXT: "TextField",
+    FieldType.BOOLEAN: "BooleanField",
+    FieldType.DATE: "DateField",
+    FieldType.DATETIME: "DateTimeField",
+    FieldType.TIME: "TimeField",
+    FieldType.UUID: "UUIDField",
+    FieldType.JSON: "JSONField",
+    FieldType.BINARY: "BinaryField",
+    FieldType.FILE: "FileField",
+})
+
+_DEFAULT_STRING_SCHEMA: Mapping[str, Any] = MappingProxyType({"type": "string"})
+
+_OPENAPI_SCHEMAS: Mapping[FieldType, Mapping[str, Any]] = MappingProxyType({
+    FieldType.INTEGER: MappingProxyType({"type": "integer"}),
+    FieldType.FLOAT: MappingProxyType({"type": "number", "format": "float"}),
+    FieldType.DECIMAL: MappingProxyType({"type": "number", "format": "double"}),
+    FieldType.STRING: _DEFAULT_STRING_SCHEMA,
+    FieldType.TEXT: _DEFAULT_STRING_SCHEMA,
+    FieldType.BOOLEAN: MappingProxyType({"type": "boolean"}),
+    FieldType.DATE: MappingProxyType({"type": "string", "format": "date"}),
+    FieldType.DATETIME: MappingProxyType({"type": "string", "format": "date-time"}),
+    FieldType.TIME: MappingProxyType({"type": "string", "format": "time"}),
+    FieldType.UUID: MappingProxyType({"type": "string", "format": "uuid"}),
+    FieldType.JSON: MappingProxyType({"type": "object"}),
+})
+
+
+
+@functools.lru_cache(maxsize=64)
+def _resolve_django_type(is_pk: bool, is_fk: bool, field_type: FieldType) -> str:
+    """Resolve the Django field type; only a few dozen distinct inputs exist."""
+    if is_pk and field_type == FieldType.INTEGER:
+        return "AutoField"
+
+    if is_fk:
+        return "ForeignKey"
+
+    return _DJANGO_FIELD_TYPES.get(field_type, "CharField")
+
+
+@dataclass(frozen=True, slots=True)
+class DjangoFieldOptions:
+    """Basic Django field options for a column, in compact read-only form."""
+
+    null: bool = False
+    blank: bool = False
+    unique: bool = False
+    default: Any = None
+    max_length: Optional[int] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a field keyword options dict, omitting unset options."""
+        options = {}
+
+        if self.null:
+            options['null'] = True
+        if self.blank:
+            options['blank'] = True
+        if self.unique:
+            options['unique'] = True
+        if self.default is not None:
+            options['default'] = self.default
+        if self.max_length:
+            options['max_length'] = self.max_length
+
+        return options
+
+
+def _basic_options(
+    field_type: FieldType,
+    nullable: bool,
+    is_pk: bool,
+    is_unique: bool,
+    internal_size: Optional[int],
+    default: Any
+) -> DjangoFieldOptions:
+    """Build the basic Django field options for a column."""
+    nullable_field = nullable and not is_pk
+    return DjangoFieldOptions(
+        null=nullable_field,
+        blank=nullable_field,
+        unique=is_unique and not is_pk,
+        default=default,
+        max_length=internal_size if field_type == FieldType.STRING else None
+    )
+
+
+def _basic_openapi_schema(field_type: FieldType, nullable: bool, default: Any) -> Dict[str, Any]:
+    """Build the basic OpenAPI schema for a column."""
+    schema = dict(_OPENAPI_SCHEMAS.get(field_type, _DEFAULT_STRING_SCHEMA))
+
+    if nullable:
+        schema['nullable'] = True
+
+    if default is not None:
+        schema['default'] = default
+
+    return schema
+
+
+@functools.lru_cache(maxsize=256)
+def _build_mapping(
+    field_type: FieldType,
+    nullable: bool,
+    is_pk: bool,
+    is_fk: bool,
+    is_unique: bool,
+    internal_size: Optional[int],
+    default_type: type,
+    default: Any
+) -> Tuple[str, DjangoFieldOptions, Mapping[str, Any]]:
+    """
+    Build (Django field type, options, OpenAPI schema) for a column signature.
+
+    default_type is only part of the cache key, so that defaults which compare
+    equal across types (1, 1.0, True) get separate entries. The returned
+    values are shared and read-only; callers copy them.
+    """
+    return (
+        _resolve_django_type(is_pk, is_fk, field_type),
+        _basic_options(field_type, nullable, is_pk, is_unique, internal_size, default),
+        MappingProxyType(_basic_openapi_schema(field_type, nullable, default)),
+    )
+
+
+def _is_hashable(value: Any) -> bool:
+    """Check whether a value can be part of an lru_cache key."""
+    # isinstance(value, Hashable) is not enough: a tuple holding a list
+    # passes it but still fails to hash
+    try:
+        hash(value)
+    except TypeError:
+        return False
+    return True
+
+
 class FieldMapperProtocol(Protocol):
     """Protocol for field mappers."""
     
@@ -35,14 +183,6 @@ class BaseFieldMapper(ABC):
     def map_field(self, column: ColumnInfo) -> FieldMapping:
         """Map a column to a field mapping."""
         pass
-    
-    def _validate_column(self, column: ColumnInfo) -> None:
-        """Validate column information."""
-        if not column.name:
-            raise ValueError("Column name is required")
-        
-        if not column.db_type_string:
-            raise ValueError("Database type string is required")
 
 
 class FieldMapper:
@@ -73,85 +213,23 @@ class FieldMapper:
         if not column.db_type_string:
             raise ValueError("Database type string is required")
         
+        # Columns with the same signature map identically, so the parts come
+        # from a cache; defaults that cannot be hashed are built directly
+        default = column.default
+        key = (
+            column.field_type, column.nullable, column.is_pk,
+            column.is_foreign_key, column.is_unique, column.internal_size,
+            type(default), default
+        )
+        build = _build_mapping if _is_hashable(default) else _build_mapping.__wrapped__
+        django_field_type, options, schema = build(*key)
+        
         # Create basic mapping - full implementation will be in service layer
         mapping = FieldMapping(
             column=column,
-            django_field_type=self._get_django_field_type(column),
-            django_field_options=self._get_basic_options(column),
-            openapi_schema=self._get_basic_openapi_schema(column)
+            django_field_type=django_field_type,
+            django_field_options=options.to_dict(),
+            openapi_schema=dict(schema)
         )
         
         return mapping
-    
-    def _get_django_field_type(self, column: ColumnInfo) -> str:
-        """Get Django field type for column."""
-        if column.is_pk and column.field_type == FieldType.INTEGER:
-            return "AutoField"
-        
-        if column.is_foreign_key:
-            return "ForeignKey"
-        
-        # Basic field type mapping
-        field_type_mapping = {
-            FieldType.AUTO: "AutoField",
-            FieldType.INTEGER: "IntegerField",
-            FieldType.FLOAT: "FloatField",
-            FieldType.DECIMAL: "DecimalField",
-            FieldType.STRING: "CharField",
-            FieldType.TEXT: "TextField",
-            FieldType.BOOLEAN: "BooleanField",
-            FieldType.DATE: "DateField",
-            FieldType.DATETIME: "DateTimeField",
-            FieldType.TIME: "TimeField",
-            FieldType.UUID: "UUIDField",
-            FieldType.JSON: "JSONField",
-            FieldType.BINARY: "BinaryField",
-            FieldType.FILE: "FileField",
-        }
-        
-        return field_type_mapping.get(column.field_type, "CharField")
-    
-    def _get_basic_options(self, column: ColumnInfo) -> Dict[str, Any]:
-        """Get basic Django field options."""
-        options = {}
-        
-        if column.nullable and not column.is_pk:
-            options['null'] = True
-            options['blank'] = True
-        
-        if column.is_unique and not column.is_pk:
-            options['unique'] = True
-        
-        if column.default is not None:
-            options['default'] = column.default
-        
-        if column.internal_size and column.field_type == FieldType.STRING:
-            options['max_length'] = column.internal_size
-        
-        return options
-    
-    def _get_basic_openapi_schema(self, column: ColumnInfo) -> Dict[str, Any]:
-        """Get basic OpenAPI schema."""
-        schema_mapping = {
-            FieldType.INTEGER: {"type": "integer"},
-            FieldType.FLOAT: {"type": "number", "format": "float"},
-            FieldType.DECIMAL: {"type": "number", "format": "double"},
-            FieldType.STRING: {"type": "string"},
-            FieldType.TEXT: {"type": "string"},
-            FieldType.BOOLEAN: {"type": "boolean"},
-            FieldType.DATE: {"type": "string", "format": "date"},
-            FieldType.DATETIME: {"type": "string", "format": "date-time"},
-            FieldType.TIME: {"type": "string", "format": "time"},
-            FieldType.UUID: {"type": "string", "format": "uuid"},
-            FieldType.JSON: {"type": "object"},
-        }
-        
-        schema = schema_mapping.get(column.field_type, {"type": "string"}).copy()
-        
-        if column.nullable:
-            schema['nullable'] = True
-        
-        if column.default is not None:
-            schema['default'] = column.default
-        
-        return schema
\ No newline at end of file
@@ -7,8 +7,10 @@ for all code generation operations.
 """
 
 from dataclasses import dataclass, field
-from typing import List, Dict, Any, Optional, Set
+from functools import cached_property, lru_cache
+from typing import List, Dict, Any, Iterable, Optional, Set, Tuple
 from enum import Enum
+import re
 import uuid
 
 
@@ -43,7 +45,84 @@ class FieldType(Enum):
     UNKNOWN = "unknown"
 
 
-@dataclass
+# Enum -> serialized value maps so to_dict() skips the ``.value`` descriptor
+_FIELD_TYPE_VALUES: Dict[FieldType, str] = {ft: ft.value for ft in FieldType}
+_RELATIONSHIP_TYPE_VALUES: Dict[RelationshipType, str] = {
+    rt: rt.value for rt in RelationshipType
+}
+# Hyphenated form ('many-to-one') expected by the AST generators
+_RELATIONSHIP_TYPE_TAGS: Dict[RelationshipType, str] = {
+    rt: rt.value.replace('_', '-') for rt in RelationshipType
+}
+
+
+# Substrings of a database type string that identify its field type
+_TYPE_TOKENS: Dict[str, FieldType] = {
+    'auto': FieldType.AUTO,
+    'int': FieldType.INTEGER,
+    'serial': FieldType.INTEGER,
+    'float': FieldType.FLOAT,
+    'real': FieldType.FLOAT,
+    'double': FieldType.FLOAT,
+    'decimal': FieldType.DECIMAL,
+    'numeric': FieldType.DECIMAL,
+    'varchar': FieldType.STRING,
+    'char': FieldType.STRING,
+    'text': FieldType.TEXT,
+    'clob': FieldType.TEXT,
+    'bool': FieldType.BOOLEAN,
+    'bit': FieldType.BOOLEAN,
+    'date': FieldType.DATE,
+    'time': FieldType.TIME,
+    'uuid': FieldType.UUID,
+    'guid': FieldType.UUID,
+    'jsonb': FieldType.JSON,
+    'json': FieldType.JSON,
+    'blob': FieldType.BINARY,
+    'binary': FieldType.BINARY,
+}
+
+# Zero-width lookahead so overlapping tokens (e.g. 'varchar' and 'char') are
+# all reported, mirroring independent substring checks
+_TYPE_TOKEN_RE = re.compile('(?=(' + '|'.join(_TYPE_TOKENS) + '))')
+
+# Checked in order; the first type found in the string wins
+_TYPE_PRECEDENCE = (
+    FieldType.AUTO,
+    FieldType.INTEGER,
+    FieldType.FLOAT,
+    FieldType.DECIMAL,
+    FieldType.STRING,
+    FieldType.TEXT,
+    FieldType.BOOLEAN,
+    FieldType.DATETIME,
+    FieldType.DATE,
+    FieldType.TIME,
+    FieldType.UUID,
+    FieldType.JSON,
+    FieldType.BINARY,
+)
+
+
+# A schema uses a handful of distinct type strings across all its columns
+@lru_cache(maxsize=256)
+def _field_type_for(db_type_string: str) -> FieldType:
+    """Map a database type string to its field type category."""
+    # One scan collects every type token present (overlapping, so this
+    # matches plain substring checks); precedence is applied below
+    types = {_TYPE_TOKENS[token] for token in _TYPE_TOKEN_RE.findall(db_type_string.lower())}
+    if not types:
+        return FieldType.UNKNOWN
+
+    if FieldType.DATE in types and FieldType.TIME in types:
+        types.add(FieldType.DATETIME)
+    for field_type in _TYPE_PRECEDENCE:
+        if field_type in types:
+            return field_type
+    return FieldType.UNKNOWN
+
+
+@dataclass(slots=True)
 class ColumnInfo:
     """
     Represents a database column with all its properties.
@@ -93,36 +172,9 @@ class ColumnInfo:
 
     def _infer_field_type(self) -> FieldType:
         """Infer the field type from database type string."""
-        db_type_lower = self.db_type_string.lower()
-
-        if 'auto' in db_type_lower or self.is_auto_increment:
+        if self.is_auto_increment:
             return FieldType.AUTO
-        elif any(t in db_type_lower for t in ['int', 'serial']):
-            return FieldType.INTEGER
-        elif any(t in db_type_lower for t in ['float', 'real', 'double']):
-            return FieldType.FLOAT
-        elif any(t in db_type_lower for t in ['decimal', 'numeric']):
-            return FieldType.DECIMAL
-        elif any(t in db_type_lower for t in ['char', 'varchar']):
-            return FieldType.STRING
-        elif any(t in db_type_lower for t in ['text', 'clob']):
-            return FieldType.TEXT
-        elif any(t in db_type_lower for t in ['bool', 'bit']):
-            return FieldType.BOOLEAN
-        elif 'date' in db_type_lower and 'time' in db_type_lower:
-            return FieldType.DATETIME
-        elif 'date' in db_type_lower:
-            return FieldType.DATE
-        elif 'time' in db_type_lower:
-            return FieldType.TIME
-        elif any(t in db_type_lower for t in ['uuid', 'guid']):
-            return FieldType.UUID
-        elif any(t in db_type_lower for t in ['json', 'jsonb']):
-            return FieldType.JSON
-        elif any(t in db_type_lower for t in ['blob', 'binary']):
-            return FieldType.BINARY
-        else:
-            return FieldType.UNKNOWN
+        return _field_type_for(self.db_type_string)
 
     @property
     def is_required(self) -> bool:
@@ -152,12 +204,23 @@ class ColumnInfo:
             'foreign_key_to': self.foreign_key_to,
             'enum_values': self.enum_values,
             'is_auto_increment': self.is_auto_increment,
-            'field_type': self.field_type.value if self.field_type else None,
+            'field_type': _FIELD_TYPE_VALUES[self.field_type] if self.field_type else None,
             'django_field_type': self.django_field_type
         }
 
 
-@dataclass
+# Many relationships share a source table; reuse one related_name string each
+@lru_cache(maxsize=4096)
+def _related_set_name(source_table: str) -> str:
+    return f"{source_table}_set"
+
+
+@lru_cache(maxsize=4096)
+def _related_plural_name(source_table: str) -> str:
+    return f"{source_table}s"
+
+
+@dataclass(slots=True)
 class RelationshipInfo:
     """
     Represents a relationship between tables.
@@ -201,9 +264,9 @@ class RelationshipInfo:
     def _generate_related_name(self) -> str:
         """Generate a related name for the relationship."""
         if self.relationship_type == RelationshipType.MANY_TO_MANY:
-            return f"{self.source_table}_set"
+            return _related_set_name(self.source_table)
         else:
-            return f"{self.source_table}s"
+            return _related_plural_name(self.source_table)
 
     @property
     def is_reverse_relationship(self) -> bool:
@@ -238,8 +301,8 @@ class RelationshipInfo:
 
         return {
             'name': self.name,
-            'type': self.relationship_type.value.replace('_', '-'),  # Convert to format expected by AST
-            'relationship_type': self.relationship_type.value,
+            'type': _RELATIONSHIP_TYPE_TAGS[self.relationship_type],
+            'relationship_type': _RELATIONSHIP_TYPE_VALUES[self.relationship_type],
             'source_table': self.source_table,
             'target_table': self.target_table,
             'source_columns': self.source_columns,
@@ -256,7 +319,7 @@ class RelationshipInfo:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class ConstraintInfo:
     """
     Represents a database constraint.
@@ -289,6 +352,24 @@ class ConstraintInfo:
         }
 
 
+@lru_cache(maxsize=4096)
+def _snake_to_pascal(name: str) -> str:
+    """Convert a snake_case table name to PascalCase."""
+    if '_' not in name:
+        return name.capitalize()
+    return ''.join(word.capitalize() for word in name.split('_'))
+
+
+# Names of the cached entries cleared by TableInfo.invalidate_caches
+_TABLE_CACHED_ATTRS = (
+    'foreign_key_columns',
+    'unique_columns',
+    'required_columns',
+    '_is_m2m_through',
+    '_columns_by_name',
+)
+
+
 @dataclass
 class TableInfo:
     """
@@ -296,6 +377,11 @@ class TableInfo:
 
     This is the main aggregate model that contains all information
     needed to generate Django models, serializers, views, etc.
+
+    Unlike the other domain models this one keeps its ``__dict__``: the
+    mapper attaches extra attributes (e.g. ``db_check_constraints``) while
+    building the intermediate representation, and the column scans are
+    cached there with ``cached_property``.
     """
 
     # Basic table info
@@ -330,9 +416,7 @@ class TableInfo:
 
     def _generate_model_name(self) -> str:
         """Generate a Django model name from the table name."""
-        # Convert snake_case to PascalCase
-        words = self.name.split('_')
-        return ''.join(word.capitalize() for word in words)
+        return _snake_to_pascal(self.name)
 
     @property
     def has_primary_key(self) -> bool:
@@ -344,27 +428,45 @@ class TableInfo:
         """Check if table has a composite primary key."""
         return len(self.primary_key_columns) > 1
 
-    @property
+    @cached_property
     def foreign_key_columns(self) -> List[ColumnInfo]:
         """Get all foreign key columns."""
         return [col for col in self.columns if col.is_foreign_key]
 
-    @property
+    @cached_property
     def unique_columns(self) -> List[ColumnInfo]:
         """Get all unique columns."""
         return [col for col in self.columns if col.is_unique]
 
-    @property
+    @cached_property
     def required_columns(self) -> List[ColumnInfo]:
         """Get all required (non-nullable, no default) columns."""
         return [col for col in self.columns if col.is_required]
 
+    def invalidate_caches(self) -> None:
+        """
+        Drop the cached column scans.
+
+        Call this after mutating ``columns`` (or a column's flags) once the
+        table has been built.
+        """
+        for name in _TABLE_CACHED_ATTRS:
+            self.__dict__.pop(name, None)
+
     def get_column_by_name(self, name: str) -> Optional[ColumnInfo]:
-        """Get a column by name."""
-        for col in self.columns:
-            if col.name == name:
-                return col
-        return None
+        """
+        Get a column by name.
+
+        The name index is rebuilt whenever ``columns`` is reassigned or
+        changes length, so appended columns are found without invalidating.
+        """
+        columns = self.columns
+        index = getattr(self, '_columns_by_name', None)
+        if index is None or index[0] is not columns or index[1] != len(columns):
+            # Reversed so the first column wins if a name is ever duplicated
+            index = (columns, len(columns), {col.name: col for col in reversed(columns)})
+            self._columns_by_name = index
+        return index[2].get(name)
 
     def get_relationships_by_type(self, rel_type: RelationshipType) -> List[RelationshipInfo]:
         """Get relationships of a specific type."""
@@ -379,6 +481,10 @@ class TableInfo:
         - Composite primary key matches the foreign key columns
         - No other significant columns
         """
+        return self._is_m2m_through
+
+    @cached_property
+    def _is_m2m_through(self) -> bool:
         fk_columns = self.foreign_key_columns
         if len(fk_columns) != 2:
             return False
@@ -408,7 +514,7 @@ class TableInfo:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class FieldMapping:
     """
     Represents the mapping from a database column to Django field.
@@ -449,7 +555,7 @@ class FieldMapping:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class GenerationContext:
     """
     Context information for code generation operations.
@@ -479,10 +585,20 @@ class GenerationContext:
     generation_timestamp: Optional[str] = None
     generator_version: Optional[str] = None
 
+    # (tables list, its length, name -> table index), built on the first
+    # get_table_by_name() call and rebuilt when ``tables`` changes size
+    _tables_by_name: Optional[Tuple[List[TableInfo], int, Dict[str, TableInfo]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
     def mark_table_processed(self, table_name: str):
         """Mark a table as processed."""
         self.processed_tables.add(table_name)
 
+    def mark_tables_processed(self, table_names: Iterable[str]):
+        """Mark several tables as processed in one call."""
+        self.processed_tables.update(table_names)
+
     def mark_component_generated(self, component_name: str):
         """Mark a component as generated."""
         self.generated_components.add(component_name)
@@ -497,13 +613,25 @@ class GenerationContext:
 
     def get_table_by_name(self, name: str) -> Optional[TableInfo]:
         """Get a table by name."""
-        for table in self.tables:
-            if table.name == name:
-                return table
-        return None
+        tables = self.tables
+        index = self._tables_by_name
+        if index is None or index[0] is not tables or index[1] != len(tables):
+            index = (tables, len(tables), {table.name: table for table in reversed(tables)})
+            self._tables_by_name = index
+        return index[2].get(name)
+
+    def invalidate_table_index(self) -> None:
+        """
+        Drop the name index.
+
+        Appending, removing or reassigning ``tables`` is picked up
+        automatically; this is only needed after replacing an entry in place
+        or renaming a table.
+        """
+        self._tables_by_name = None
 
 
-@dataclass
+@dataclass(slots=True)
 class GenerationResult:
     """
     Result of a code generation operation.
@@ -533,7 +661,10 @@ class GenerationResult:
     def __post_init__(self):
         """Post-initialization processing."""
         if self.code_lines is None:
-            self.code_lines = len(self.code.splitlines())
+            # Count newlines instead of building the list splitlines() returns;
+            # a final line without a trailing newline still counts.
+            code = self.code
+            self.code_lines = code.count('\n') + (1 if code and not code.endswith('\n') else 0)
 
     def add_validation_error(self, error: str):
         """Add a validation error."""
@@ -5,6 +5,7 @@ This module provides utilities for converting between different naming conventio
 used in database schemas, Django models, and Python code.
 """
 
+import functools
 import re
 from typing import Set
 import inflect
@@ -15,6 +16,27 @@ from ..constants import FieldNames
 # Initialize inflect engine for pluralization
 p = inflect.engine()
 
+# Patterns used by to_snake_case / clean_field_name, compiled once
+_CAMEL_WORD_RE = re.compile("(.)([A-Z][a-z]+)")
+_DOUBLE_UNDERSCORE_RE = re.compile("__([A-Z])")
+_LOWER_UPPER_RE = re.compile("([a-z0-9])([A-Z])")
+_INVALID_IDENTIFIER_CHARS_RE = re.compile(r"[^a-zA-Z0-9_]")
+
+
+# inflect's rule-based morphology is slow and table names repeat a lot
+# (every foreign key to a table asks for the same forms), so memoize it.
+@functools.lru_cache(maxsize=4096)
+def _singular(name: str) -> str:
+    """Return the singular form of ``name``, or ``name`` if inflect has none."""
+    # inflect returns False if already singular or irregular
+    return p.singular_noun(name) or name
+
+
+@functools.lru_cache(maxsize=4096)
+def _plural(name: str) -> str:
+    """Return the plural form of ``name``."""
+    return p.plural(name)
+
 
 def to_snake_case(name: str) -> str:
     """
@@ -39,10 +61,16 @@ def to_snake_case(name: str) -> str:
     """
     if not isinstance(name, str):
         raise TypeError(f"Expected string, got {type(name).__name__}")
-        
-    name = re.sub("(.)([A-Z][a-z]+)", r"\1_\2", name)
-    name = re.sub("__([A-Z])", r"_\1", name)
-    name = re.sub("([a-z0-9])([A-Z])", r"\1_\2", name)
+
+    # Every pattern below needs an uppercase letter; most column names
+    # are already lowercase, so skip the regex passes for them.
+    lowered = name.lower()
+    if lowered == name:
+        return lowered
+
+    name = _CAMEL_WORD_RE.sub(r"\1_\2", name)
+    name = _DOUBLE_UNDERSCORE_RE.sub(r"_\1", name)
+    name = _LOWER_UPPER_RE.sub(r"\1_\2", name)
     return name.lower()
 
 
@@ -71,16 +99,12 @@ def to_pascal_case(name: str) -> str:
         raise TypeError(f"Expected string, got {type(name).__name__}")
         
     # Try to singularize table names for model names
-    singular_name = p.singular_noun(name)
-    if singular_name is False:  # inflect returns False if already singular or irregular
-        singular_name = name
-    # Handle cases like 'data' -> 'Data', 'series' -> 'Series' where singular is same
-    if not singular_name:
-        singular_name = name
+    singular_name = _singular(name)
 
     return "".join(word.capitalize() for word in singular_name.split("_"))
 
 
+@functools.lru_cache(maxsize=4096)
 def clean_field_name(name: str) -> str:
     """
     Ensure field name is a valid Python identifier and not a reserved keyword.
@@ -108,7 +132,7 @@ def clean_field_name(name: str) -> str:
     """
     name = to_snake_case(name)
     # Remove invalid characters (allow underscore)
-    name = re.sub(r"[^a-zA-Z0-9_]", "", name)
+    name = _INVALID_IDENTIFIER_CHARS_RE.sub("", name)
     # Ensure it starts with a letter or underscore
     if name and not name[0].isalpha() and name[0] != "_":
         name = "_" + name
@@ -118,10 +142,6 @@ def clean_field_name(name: str) -> str:
     if name in keywords:
         name += "_"
     
-    # Handle potential clash with 'pk' if the column name wasn't originally 'pk'
-    if name == "pk" and name != "pk":
-        name = "pk_val"  # Or another suitable suffix
-    
     return name if name else "_field"  # Ensure non-empty name
 
 
@@ -165,7 +185,7 @@ def generate_related_name(source_table: str, field_name: str = None) -> str:
     Returns:
         Related name for reverse relationship
     """
-    base_name = p.plural(source_table)
+    base_name = _plural(source_table)
     if field_name:
         return f"{base_name}_{field_name}"
     return base_name
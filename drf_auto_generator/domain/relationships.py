@@ -5,8 +5,17 @@ This module contains the core business logic for analyzing and resolving
 database relationships for Django model generation.
 """
 
-from typing import List, Dict, Set
-from drf_auto_generator.domain.models import TableInfo, RelationshipInfo, RelationshipType
+from collections import defaultdict
+from typing import Dict, Iterable, List, Set, Tuple
+from drf_auto_generator.domain.models import ColumnInfo, TableInfo, RelationshipInfo, RelationshipType
+
+
+# Bookkeeping columns that do not stop a table from counting as an M2M
+# through table (compared against the lowercased column name)
+_TIMESTAMP_COLUMNS = frozenset({
+    "created_at", "updated_at", "created", "modified",
+    "creation_date", "modification_date", "timestamp",
+})
 
 
 class RelationshipAnalyzer:
@@ -20,7 +29,10 @@ class RelationshipAnalyzer:
     def __init__(self):
         """Initialize relationship analyzer."""
         self.analyzed_tables: Set[str] = set()
-        self.relationship_cache: Dict[str, List[RelationshipInfo]] = {}
+        # table name -> (fk columns, pk columns, substantial columns)
+        self._column_partitions: Dict[
+            str, Tuple[List[ColumnInfo], List[ColumnInfo], List[ColumnInfo]]
+        ] = {}
 
     def analyze_relationships(self, tables: List[TableInfo]) -> List[RelationshipInfo]:
         """
@@ -32,17 +44,21 @@ class RelationshipAnalyzer:
         Returns:
             List of discovered relationships
         """
-        relationships = []
-        table_map = {table.name: table for table in tables}
+        # Cached results depend on the set of tables they were analyzed against
+        self._column_partitions.clear()
+        self.analyzed_tables.clear()
+        if not tables:
+            return []
 
-        for table in tables:
-            table_relationships = self.analyze_table_relationships(table, table_map)
-            relationships.extend(table_relationships)
-
-        # Deduplicate and resolve conflicts
-        relationships = self._deduplicate_relationships(relationships)
+        table_map = {table.name: table for table in tables}
 
-        return relationships
+        # Deduplicate as relationships are produced, without first
+        # collecting every table's results into one intermediate list
+        return self._deduplicate_relationships(
+            relationship
+            for table in tables
+            for relationship in self.analyze_table_relationships(table, table_map)
+        )
 
     def analyze_table_relationships(
         self,
@@ -69,8 +85,19 @@ class RelationshipAnalyzer:
         m2m_relationships = self._analyze_many_to_many(table, all_tables)
         relationships.extend(m2m_relationships)
 
+        self.analyzed_tables.add(table.name)
         return relationships
 
+    def invalidate(self, table_name: str) -> None:
+        """
+        Drop all cached results for a table so the next call re-analyzes it.
+
+        Args:
+            table_name: Name of the table whose cached results to drop
+        """
+        self._column_partitions.pop(table_name, None)
+        self.analyzed_tables.discard(table_name)
+
     def _analyze_foreign_keys(
         self,
         table: TableInfo,
@@ -79,8 +106,9 @@ class RelationshipAnalyzer:
         """Analyze foreign key relationships."""
         relationships = []
 
-        for column in table.columns:
-            if column.is_foreign_key and column.foreign_key_to:
+        fk_columns, _, _ = self._partition_columns(table)
+        for column in fk_columns:
+            if column.foreign_key_to:
                 target_table, target_column = column.foreign_key_to
 
                 if target_table in all_tables:
@@ -89,7 +117,7 @@ class RelationshipAnalyzer:
                     related_name = f"{table.name}_{relationship_name}_set"
 
                     relationship = RelationshipInfo(
-                        name=self._generate_relationship_name(column.name),
+                        name=relationship_name,
                         relationship_type=RelationshipType.MANY_TO_ONE,
                         source_table=table.name,
                         target_table=target_table,
@@ -142,15 +170,12 @@ class RelationshipAnalyzer:
 
     def _is_many_to_many_through_table(self, table: TableInfo, all_tables: Dict[str, TableInfo]) -> bool:
         """Determine if a table is a M2M through table using sophisticated heuristics."""
-        fk_columns = self._get_foreign_key_columns(table)
+        fk_columns, pk_fields, substantial_fields = self._partition_columns(table)
 
         # Must have exactly 2 FKs
         if len(fk_columns) != 2:
             return False
 
-        # Get PK fields
-        pk_fields = [col for col in table.columns if col.is_pk]
-
         # Check if PK consists of both FK columns (composite key)
         if len(pk_fields) >= 2:
             pk_field_names = [col.name for col in pk_fields]
@@ -161,20 +186,40 @@ class RelationshipAnalyzer:
                 return True
 
         # Alternative check: table only has 2 FKs and minimal other fields
-        substantial_fields = [
-            col for col in table.columns
-            if not col.is_pk and not col.is_foreign_key and
-            col.name.lower() not in (
-                "created_at", "updated_at", "created", "modified",
-                "creation_date", "modification_date", "timestamp"
-            )
-        ]
-
         return len(substantial_fields) <= 1
 
     def _get_foreign_key_columns(self, table: TableInfo):
         """Get foreign key columns from a table."""
-        return [col for col in table.columns if col.is_foreign_key]
+        return self._partition_columns(table)[0]
+
+    def _partition_columns(
+        self, table: TableInfo
+    ) -> Tuple[List[ColumnInfo], List[ColumnInfo], List[ColumnInfo]]:
+        """
+        Split a table's columns into FK, PK and substantial columns in one pass.
+
+        Substantial columns are neither keys nor timestamp bookkeeping; the
+        M2M heuristics count them. Results are kept per table name for the
+        current analyze_relationships() run.
+        """
+        partition = self._column_partitions.get(table.name)
+        if partition is not None:
+            return partition
+
+        fk_columns = []
+        pk_columns = []
+        substantial_columns = []
+        for col in table.columns:
+            if col.is_foreign_key:
+                fk_columns.append(col)
+            if col.is_pk:
+                pk_columns.append(col)
+            elif not col.is_foreign_key and col.name.lower() not in _TIMESTAMP_COLUMNS:
+                substantial_columns.append(col)
+
+        partition = (fk_columns, pk_columns, substantial_columns)
+        self._column_partitions[table.name] = partition
+        return partition
 
     def _create_self_referential_m2m(
         self, through_table: TableInfo, target_table_name: str,
@@ -258,11 +303,11 @@ class RelationshipAnalyzer:
 
     def _deduplicate_relationships(
         self,
-        relationships: List[RelationshipInfo]
+        relationships: Iterable[RelationshipInfo]
     ) -> List[RelationshipInfo]:
-        """Remove duplicate relationships."""
-        seen = set()
-        unique_relationships = []
+        """Remove duplicate relationships, keeping the first of each."""
+        # Insertion-ordered dict doubles as the seen-set and the result
+        unique_relationships: Dict[tuple, RelationshipInfo] = {}
 
         for rel in relationships:
             # Create a unique key for the relationship
@@ -273,12 +318,9 @@ class RelationshipAnalyzer:
                 tuple(rel.source_columns),
                 tuple(rel.target_columns)
             )
+            unique_relationships.setdefault(key, rel)
 
-            if key not in seen:
-                seen.add(key)
-                unique_relationships.append(rel)
-
-        return unique_relationships
+        return list(unique_relationships.values())
 
 
 class RelationshipResolver:
@@ -310,12 +352,10 @@ class RelationshipResolver:
         """
         resolved = relationships.copy()
 
-        # Resolve naming conflicts
+        # Resolve naming conflicts; self-referential relationships are
+        # adjusted in the same pass once their final name is known
         resolved = self._resolve_naming_conflicts(resolved)
 
-        # Handle self-referential relationships
-        resolved = self._handle_self_referential(resolved)
-
         # Optimize relationship definitions
         resolved = self._optimize_relationships(resolved)
 
@@ -326,43 +366,42 @@ class RelationshipResolver:
         relationships: List[RelationshipInfo]
     ) -> List[RelationshipInfo]:
         """Resolve naming conflicts between relationships."""
+        if not relationships:
+            return relationships
+
         # Group relationships by source table
-        by_source = {}
+        by_source = defaultdict(list)
         for rel in relationships:
-            if rel.source_table not in by_source:
-                by_source[rel.source_table] = []
             by_source[rel.source_table].append(rel)
 
         # Check for naming conflicts within each table
         for source_table, rels in by_source.items():
             names_used = set()
+            # Next suffix to try per base name; lower suffixes are known taken
+            next_suffix: Dict[str, int] = {}
 
             for rel in rels:
                 original_name = rel.name
-                counter = 1
-
-                while rel.name in names_used:
-                    rel.name = f"{original_name}_{counter}"
-                    counter += 1
+                if original_name in names_used:
+                    counter = next_suffix.get(original_name, 1)
+                    while rel.name in names_used:
+                        rel.name = f"{original_name}_{counter}"
+                        counter += 1
+                    next_suffix[original_name] = counter
 
                 names_used.add(rel.name)
+                self._adjust_self_referential(rel)
 
         return relationships
 
-    def _handle_self_referential(
-        self,
-        relationships: List[RelationshipInfo]
-    ) -> List[RelationshipInfo]:
-        """Handle self-referential relationships."""
-        for rel in relationships:
-            if rel.source_table == rel.target_table:
-                rel.is_self_referential = True
-
-                # Adjust related_name to avoid conflicts
-                if not rel.related_name.endswith('_children'):
-                    rel.related_name = f"{rel.name}_children"
+    def _adjust_self_referential(self, rel: RelationshipInfo) -> None:
+        """Flag a self-referential relationship and give it a clash-free related_name."""
+        if rel.source_table == rel.target_table:
+            rel.is_self_referential = True
 
-        return relationships
+            # Adjust related_name to avoid conflicts
+            if not rel.related_name.endswith('_children'):
+                rel.related_name = f"{rel.name}_children"
 
     def _optimize_relationships(
         self,
@@ -5,7 +5,8 @@ This module provides a comprehensive exception system with rich context
 and error recovery guidance for contributors and users.
 """
 
-from typing import Dict, Any, Optional, List
+import re
+from typing import Dict, Any, Optional, Sequence
 
 
 class DRFAutoGeneratorError(Exception):
@@ -19,7 +20,7 @@ class DRFAutoGeneratorError(Exception):
         self, 
         message: str, 
         context: Optional[Dict[str, Any]] = None,
-        suggestions: Optional[List[str]] = None,
+        suggestions: Optional[Sequence[str]] = None,
         error_code: Optional[str] = None
     ):
         """
@@ -56,6 +57,15 @@ class DRFAutoGeneratorError(Exception):
         return "\n".join(lines)
 
 
+# Recovery steps each error class shows when the caller passes no suggestions
+_CONFIGURATION_SUGGESTIONS = (
+    "Check the configuration file syntax",
+    "Verify all required fields are present",
+    "Run the configuration validator",
+    "Check the documentation for configuration examples",
+)
+
+
 class ConfigurationError(DRFAutoGeneratorError):
     """Raised when configuration is invalid or missing."""
     
@@ -64,14 +74,7 @@ class ConfigurationError(DRFAutoGeneratorError):
         if config_file:
             context['config_file'] = config_file
             
-        suggestions = kwargs.get('suggestions', [])
-        if not suggestions:
-            suggestions = [
-                "Check the configuration file syntax",
-                "Verify all required fields are present",
-                "Run the configuration validator",
-                "Check the documentation for configuration examples"
-            ]
+        suggestions = kwargs.get('suggestions') or _CONFIGURATION_SUGGESTIONS
             
         super().__init__(
             message, 
@@ -81,6 +84,14 @@ class ConfigurationError(DRFAutoGeneratorError):
         )
 
 
+_INTROSPECTION_SUGGESTIONS = (
+    "Check database connection settings",
+    "Verify the table/column exists in the database",
+    "Check database user permissions",
+    "Review the include/exclude table filters",
+)
+
+
 class SchemaIntrospectionError(DRFAutoGeneratorError):
     """Raised when database schema introspection fails."""
     
@@ -91,14 +102,7 @@ class SchemaIntrospectionError(DRFAutoGeneratorError):
         if column:
             context['column'] = column
             
-        suggestions = kwargs.get('suggestions', [])
-        if not suggestions:
-            suggestions = [
-                "Check database connection settings",
-                "Verify the table/column exists in the database",
-                "Check database user permissions",
-                "Review the include/exclude table filters"
-            ]
+        suggestions = kwargs.get('suggestions') or _INTROSPECTION_SUGGESTIONS
             
         super().__init__(
             message,
@@ -108,6 +112,14 @@ class SchemaIntrospectionError(DRFAutoGeneratorError):
         )
 
 
+_FIELD_MAPPING_SUGGESTIONS = (
+    "Check if the database type is supported",
+    "Add a custom field mapping configuration",
+    "Consider using a generic Django field type",
+    "Report this as a new field type request",
+)
+
+
 class FieldMappingError(DRFAutoGeneratorError):
     """Raised when field type mapping fails."""
     
@@ -118,14 +130,7 @@ class FieldMappingError(DRFAutoGeneratorError):
         if django_field:
             context['django_field'] = django_field
             
-        suggestions = kwargs.get('suggestions', [])
-        if not suggestions:
-            suggestions = [
-                "Check if the database type is supported",
-                "Add a custom field mapping configuration",
-                "Consider using a generic Django field type",
-                "Report this as a new field type request"
-            ]
+        suggestions = kwargs.get('suggestions') or _FIELD_MAPPING_SUGGESTIONS
             
         super().__init__(
             message,
@@ -135,6 +140,14 @@ class FieldMappingError(DRFAutoGeneratorError):
         )
 
 
+_CODE_GENERATION_SUGGESTIONS = (
+    "Check the table schema for unsupported patterns",
+    "Verify all dependencies are available",
+    "Try generating one component at a time",
+    "Check for naming conflicts or reserved words",
+)
+
+
 class CodeGenerationError(DRFAutoGeneratorError):
     """Raised when AST code generation fails."""
     
@@ -145,14 +158,7 @@ class CodeGenerationError(DRFAutoGeneratorError):
         if table:
             context['table'] = table
             
-        suggestions = kwargs.get('suggestions', [])
-        if not suggestions:
-            suggestions = [
-                "Check the table schema for unsupported patterns",
-                "Verify all dependencies are available",
-                "Try generating one component at a time",
-                "Check for naming conflicts or reserved words"
-            ]
+        suggestions = kwargs.get('suggestions') or _CODE_GENERATION_SUGGESTIONS
             
         super().__init__(
             message,
@@ -162,6 +168,14 @@ class CodeGenerationError(DRFAutoGeneratorError):
         )
 
 
+_RELATIONSHIP_SUGGESTIONS = (
+    "Check foreign key constraints in the database",
+    "Verify both tables are included in generation",
+    "Consider manual relationship configuration",
+    "Check for circular dependencies",
+)
+
+
 class RelationshipError(DRFAutoGeneratorError):
     """Raised when relationship analysis or generation fails."""
     
@@ -181,14 +195,7 @@ class RelationshipError(DRFAutoGeneratorError):
         if relationship_type:
             context['relationship_type'] = relationship_type
             
-        suggestions = kwargs.get('suggestions', [])
-        if not suggestions:
-            suggestions = [
-                "Check foreign key constraints in the database",
-                "Verify both tables are included in generation",
-                "Consider manual relationship configuration",
-                "Check for circular dependencies"
-            ]
+        suggestions = kwargs.get('suggestions') or _RELATIONSHIP_SUGGESTIONS
             
         super().__init__(
             message,
@@ -198,6 +205,14 @@ class RelationshipError(DRFAutoGeneratorError):
         )
 
 
+_VALIDATION_SUGGESTIONS = (
+    "Run the built-in validators for more details",
+    "Check the generated code syntax",
+    "Verify all imports and dependencies",
+    "Review the validation rules",
+)
+
+
 class ValidationError(DRFAutoGeneratorError):
     """Raised when validation of generated code or configuration fails."""
     
@@ -206,14 +221,7 @@ class ValidationError(DRFAutoGeneratorError):
         if validator:
             context['validator'] = validator
             
-        suggestions = kwargs.get('suggestions', [])
-        if not suggestions:
-            suggestions = [
-                "Run the built-in validators for more details",
-                "Check the generated code syntax",
-                "Verify all imports and dependencies",
-                "Review the validation rules"
-            ]
+        suggestions = kwargs.get('suggestions') or _VALIDATION_SUGGESTIONS
             
         super().__init__(
             message,
@@ -223,6 +231,17 @@ class ValidationError(DRFAutoGeneratorError):
         )
 
 
+_DATABASE_CONNECTION_SUGGESTIONS = (
+    "Check database server is running",
+    "Verify connection credentials",
+    "Check network connectivity",
+    "Ensure database driver is installed",
+)
+
+# user:password section of a database URL
+_CREDENTIALS_RE = re.compile(r'://([^:]+):([^@]+)@')
+
+
 class DatabaseConnectionError(DRFAutoGeneratorError):
     """Raised when database connection fails."""
     
@@ -234,14 +253,7 @@ class DatabaseConnectionError(DRFAutoGeneratorError):
         if engine:
             context['engine'] = engine
             
-        suggestions = kwargs.get('suggestions', [])
-        if not suggestions:
-            suggestions = [
-                "Check database server is running",
-                "Verify connection credentials",
-                "Check network connectivity",
-                "Ensure database driver is installed"
-            ]
+        suggestions = kwargs.get('suggestions') or _DATABASE_CONNECTION_SUGGESTIONS
             
         super().__init__(
             message,
@@ -254,8 +266,15 @@ class DatabaseConnectionError(DRFAutoGeneratorError):
     def _mask_credentials(url: str) -> str:
         """Mask sensitive credentials in database URL."""
         # Simple masking - replace password with ***
-        import re
-        return re.sub(r'://([^:]+):([^@]+)@', r'://\1:***@', url)
+        return _CREDENTIALS_RE.sub(r'://\1:***@', url)
+
+
+_PLUGIN_SUGGESTIONS = (
+    "Check plugin is properly installed",
+    "Verify plugin compatibility",
+    "Check plugin configuration",
+    "Try disabling the plugin temporarily",
+)
 
 
 class PluginError(DRFAutoGeneratorError):
@@ -266,14 +285,7 @@ class PluginError(DRFAutoGeneratorError):
         if plugin_name:
             context['plugin_name'] = plugin_name
             
-        suggestions = kwargs.get('suggestions', [])
-        if not suggestions:
-            suggestions = [
-                "Check plugin is properly installed",
-                "Verify plugin compatibility",
-                "Check plugin configuration",
-                "Try disabling the plugin temporarily"
-            ]
+        suggestions = kwargs.get('suggestions') or _PLUGIN_SUGGESTIONS
             
         super().__init__(
             message,
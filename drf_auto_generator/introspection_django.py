@@ -13,6 +13,7 @@ The introspection process:
 """
 
 import logging
+import sys
 import django
 from django.db import connections, DEFAULT_DB_ALIAS
 from django.conf import settings
@@ -28,20 +29,17 @@ logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
 logger = logging.getLogger(__name__)
 
 
+# Django constraint flags in priority order; each flag name is also the
+# domain constraint type it maps to
+_CONSTRAINT_TYPE_KEYS = ('primary_key', 'unique', 'foreign_key', 'check', 'index')
+
+
 def _map_constraint_type(constraint_data: Dict[str, Any]) -> str:
     """Map Django constraint data to domain constraint type."""
-    if constraint_data.get('primary_key'):
-        return 'primary_key'
-    elif constraint_data.get('unique'):
-        return 'unique'
-    elif constraint_data.get('foreign_key'):
-        return 'foreign_key'
-    elif constraint_data.get('check'):
-        return 'check'
-    elif constraint_data.get('index'):
-        return 'index'
-    else:
-        return 'unknown'
+    for key in _CONSTRAINT_TYPE_KEYS:
+        if constraint_data.get(key):
+            return key
+    return 'unknown'
 
 # --- Django Setup Helper ---
 _django_setup_done = False
@@ -59,21 +57,23 @@ def setup_django(db_settings: Dict[str, Any], secret_key: str):
         # --- Convert Pydantic models to plain dicts for Django settings ---
         plain_db_settings: Dict[str, Dict[str, Any]] = {}
         for alias, db_model in db_settings.items():
-            # Check if it's a Pydantic model (has .dict method)
-            if hasattr(db_model, "dict") and callable(db_model.dict):
+            # Check if it's a Pydantic model (has .model_dump method)
+            if hasattr(db_model, "model_dump") and callable(db_model.model_dump):
                 # Convert to dict, excluding None values for cleaner settings
                 # This mimics Django's behavior where missing keys are handled internally
-                plain_db_settings[alias] = db_model.dict(exclude_none=True)
+                plain_db_settings[alias] = db_model.model_dump(exclude_none=True)
             elif isinstance(db_model, dict):  # If it somehow already is a dict
                 plain_db_settings[alias] = db_model  # Use as is
             else:
                 # Handle unexpected type if necessary
                 logger.error(
-                    f"Unexpected type for database settings '{alias}': {type(db_model)}. Expected Pydantic model or dict."
+                    "Unexpected type for database settings '%s': %s. Expected Pydantic model or dict.",
+                    alias,
+                    type(db_model),
                 )
                 raise TypeError(f"Invalid database settings type for alias '{alias}'.")
         # --------------------------------------------------------------------
-        logger.debug(f"Using plain DB settings for Django: {plain_db_settings}")
+        logger.debug("Using plain DB settings for Django: %s", plain_db_settings)
 
         settings.configure(
             SECRET_KEY=secret_key,
@@ -88,7 +88,7 @@ def setup_django(db_settings: Dict[str, Any], secret_key: str):
         _django_setup_done = True
         logger.info("Django setup complete.")
     except Exception as e:
-        logger.error(f"Failed to configure Django: {e}", exc_info=True)
+        logger.error("Failed to configure Django: %s", e, exc_info=True)
         raise  # Re-raise the exception to halt execution
 
 
@@ -102,6 +102,9 @@ def _get_column_details(
     precision = getattr(description, "precision", None)
     scale = getattr(description, "scale", None)
     collation = getattr(description, "collation", None)
+    if collation is not None:
+        # A schema has a handful of collations repeated on every text column
+        collation = sys.intern(collation)
     return collation, internal_size, precision, scale
 
 
@@ -110,7 +113,7 @@ class CustomPostgreSQLIntrospection(DatabaseIntrospection):
         try:
             return super().get_field_type(data_type, description)
         except Exception as e:
-            logger.error(f"Error getting field type for {data_type}: {e}. Returning TextField as fallback.")
+            logger.error("Error getting field type for %s: %s. Returning TextField as fallback.", data_type, e)
             return 'TextField'  # Fallback to TextField
 
     def is_enum_type(self, cursor, type_name):
@@ -156,7 +159,7 @@ def introspect_schema_django(
         raise RuntimeError("Django has not been set up. Call setup_django() first.")
 
     logger.info(
-        f"Starting schema introspection using Django backend for alias '{db_alias}'..."
+        "Starting schema introspection using Django backend for alias '%s'...", db_alias
     )
     try:
         # Get connection and introspector; setup_django should ensure this works
@@ -164,24 +167,26 @@ def introspect_schema_django(
         introspector = CustomPostgreSQLIntrospection(conn)
     except Exception as e:
         logger.error(
-            f"Could not get Django connection or introspector for alias '{db_alias}': {e}"
+            "Could not get Django connection or introspector for alias '%s': %s", db_alias, e
         )
         return []  # Return empty list on failure
 
     all_tables_info: List[TableInfo] = []
     processed_tables: Set[str] = set()
-    include_set = set(include_tables) if include_tables else None
-    exclude_set = set(exclude_tables) if exclude_tables else set()
+    # Validated configs already hold frozensets, which frozenset() returns as-is
+    include_set = frozenset(include_tables) if include_tables else None
+    exclude_set = frozenset(exclude_tables) if exclude_tables else frozenset()
 
     try:
         # Use a cursor for database operations
         with conn.cursor() as cursor:
             # Get all tables and views
             all_db_items = introspector.get_table_list(cursor)
-            logger.info(f"Found {len(all_db_items)} database items (tables/views).")
-            logger.debug(
-                f"Items found: {', '.join(item.name for item in all_db_items)}"
-            )
+            logger.info("Found %d database items (tables/views).", len(all_db_items))
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Items found: %s", ", ".join(item.name for item in all_db_items)
+                )
 
             # Filter tables based on include/exclude lists and type
             tables_to_process = []
@@ -196,32 +201,39 @@ def introspect_schema_django(
                     continue  # Skip if name is missing
 
                 if item_type != "t":  # Skip views
-                    logger.debug(f"Skipping item '{table_name}' (type: {item_type}).")
+                    logger.debug("Skipping item '%s' (type: %s).", table_name, item_type)
                     continue
                 if table_name in exclude_set:
-                    logger.info(f"Excluding table: {table_name}")
+                    logger.info("Excluding table: %s", table_name)
                     continue
                 if include_set and table_name not in include_set:
                     logger.debug(
-                        f"Skipping table '{table_name}' (not in include list)."
+                        "Skipping table '%s' (not in include list).", table_name
                     )
                     continue
-                tables_to_process.append(table_name)
+                # Interned so FK targets read from the relations below share it
+                tables_to_process.append(sys.intern(table_name))
 
             if not tables_to_process:
                 logger.warning("No tables selected for introspection after filtering.")
                 return []
 
-            logger.info(
-                f"Introspecting selected tables: {', '.join(tables_to_process)}"
-            )
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "Introspecting selected tables: %s", ", ".join(tables_to_process)
+                )
+
+            # Optional introspection methods are a property of the backend;
+            # once one raises NotImplementedError, skip it for later tables
+            supports_relations = True
+            supports_pk_column = True
 
             # Process each selected table
             for table_name in tables_to_process:
                 if table_name in processed_tables:
                     continue
 
-                logger.info(f"Processing table: {table_name}")
+                logger.info("Processing table: %s", table_name)
                 columns_info = []
 
                 # Get column descriptions
@@ -231,68 +243,118 @@ def introspect_schema_django(
                     )
                 except Exception as e:
                     logger.error(
-                        f"Could not get description for table '{table_name}': {e}. Skipping."
+                        "Could not get description for table '%s': %s. Skipping.", table_name, e
                     )
                     continue
 
                 # Get constraints (PK, Unique, Check, Index)
                 try:
                     constraints = introspector.get_constraints(cursor, table_name)
-                    logger.debug(f"Constraints for '{table_name}': {constraints}")
+                    logger.debug("Constraints for '%s': %s", table_name, constraints)
                 except Exception as e:
                     logger.warning(
-                        f"Could not get constraints for table '{table_name}': {e}. Constraints may be incomplete."
+                        "Could not get constraints for table '%s': %s. Constraints may be incomplete.",
+                        table_name,
+                        e,
                     )
                     constraints = {}
 
                 # Get relations (Foreign Keys)
-                try:
-                    # Returns dict: {column_name: (pointed_to_col, pointed_to_table)}
-                    relations = introspector.get_relations(cursor, table_name)
-                    logger.debug(f"Relations for '{table_name}': {relations}")
-                except NotImplementedError:
-                    logger.warning(
-                        f"Backend {conn.vendor} does not support get_relations. FK detection may rely solely on constraints."
-                    )
-                    relations = {}
-                except Exception as e:
-                    logger.warning(
-                        f"Could not get relations for table '{table_name}': {e}."
+                relations = {}
+                if supports_relations:
+                    try:
+                        # Returns dict: {column_name: (pointed_to_col, pointed_to_table)}
+                        relations = introspector.get_relations(cursor, table_name)
+                        logger.debug("Relations for '%s': %s", table_name, relations)
+                    except NotImplementedError:
+                        logger.warning(
+                            "Backend %s does not support get_relations. FK detection may rely solely on constraints.",
+                            conn.vendor,
+                        )
+                        supports_relations = False
+                    except Exception as e:
+                        logger.warning(
+                            "Could not get relations for table '%s': %s.", table_name, e
+                        )
+
+                # --- Classify constraints in one pass ---
+                # Collects the PK columns, single-column unique names, FK
+                # targets (when 'relations' gave none) and domain constraints.
+                pk_constraint = None
+                unique_single_column_names = set()
+                fk_column_map: Dict[str, Tuple[str, str]] = (
+                    {}
+                )  # {fk_col_name: (target_table, target_col)}
+                constraint_infos = []
+                for constraint_name, c_data in constraints.items():
+                    constraint_columns = c_data.get("columns", [])
+                    if pk_constraint is None and c_data.get("primary_key"):
+                        pk_constraint = c_data
+                    # Covers unique indexes as well as unique constraints
+                    if c_data.get("unique") and len(constraint_columns) == 1:
+                        unique_single_column_names.add(constraint_columns[0])
+                    # Fallback to parsing 'constraints' for FK info
+                    if (
+                        not relations
+                        and c_data.get("foreign_key")
+                        and isinstance(c_data.get("foreign_key"), tuple)
+                    ):
+                        target_table, target_col = c_data[
+                            "foreign_key"
+                        ]  # Assumes single target col
+                        if len(constraint_columns) == 1:  # Only handle single column FKs here
+                            fk_column_map[constraint_columns[0]] = (
+                                sys.intern(target_table),
+                                sys.intern(target_col),
+                            )
+                    # Convert raw constraints to domain constraint models
+                    constraint_infos.append(
+                        ConstraintInfo(
+                            name=constraint_name,
+                            constraint_type=_map_constraint_type(c_data),
+                            columns=constraint_columns,
+                            definition=c_data.get('definition'),
+                            is_deferrable=c_data.get('is_deferrable', False),
+                            initially_deferred=c_data.get('initially_deferred', False)
+                        )
                     )
-                    relations = {}
 
-                # --- Determine Primary Key Columns ---
-                pk_col_name_single = None
-                try:
-                    # Some backends only support single PK col via this method
-                    pk_col_name_single = introspector.get_primary_key_column(
-                        cursor, table_name
-                    )
-                except NotImplementedError:
-                    pass  # Ignore if not implemented, rely on constraints
-                except Exception as e:
-                    logger.warning(
-                        f"Error calling get_primary_key_column for '{table_name}': {e}"
-                    )
+                # Prefer 'relations' output if available
+                for fk_col, (target_col, target_table) in relations.items():
+                    fk_column_map[fk_col] = (sys.intern(target_table), sys.intern(target_col))
 
-                pk_constraint = next(
-                    (c for c in constraints.values() if c.get("primary_key")), None
-                )
+                # --- Determine Primary Key Columns ---
                 pk_columns_from_constraint = (
                     pk_constraint.get("columns", []) if pk_constraint else []
                 )
 
-                # Combine results: prefer constraint, fallback to single method if constraint empty
+                # Combine results: prefer constraint, fallback to single method if
+                # constraint empty. The fallback is another metadata query per
+                # table, so only issue it when the constraints had no PK.
                 final_pk_columns = pk_columns_from_constraint
-                if not final_pk_columns and pk_col_name_single:
-                    final_pk_columns = [pk_col_name_single]
+                if not final_pk_columns and supports_pk_column:
+                    pk_col_name_single = None
+                    try:
+                        # Some backends only support single PK col via this method
+                        pk_col_name_single = introspector.get_primary_key_column(
+                            cursor, table_name
+                        )
+                    except NotImplementedError:
+                        # Not implemented, rely on constraints
+                        supports_pk_column = False
+                    except Exception as e:
+                        logger.warning(
+                            "Error calling get_primary_key_column for '%s': %s", table_name, e
+                        )
+                    if pk_col_name_single:
+                        final_pk_columns = [pk_col_name_single]
                 logger.debug(
-                    f"Primary key columns for '{table_name}': {final_pk_columns}"
+                    "Primary key columns for '%s': %s", table_name, final_pk_columns
                 )
 
                 # --- Process Columns ---
                 for description in table_description:
-                    col_name = description.name
+                    col_name = sys.intern(description.name)
                     # Defaults are hard - Django often doesn't retrieve them reliably/consistently.
                     # description.default might exist but its format is backend-specific.
                     default_val = None  # Safest to assume None for now
@@ -300,8 +362,11 @@ def introspect_schema_django(
                         description
                     )
 
-                    # Get field type and enum values (if applicable)
-                    field_type = introspector.get_field_type(description.type_code, description)
+                    # Get field type and enum values (if applicable). Interned so
+                    # later comparisons against DjangoFieldTypes are identity hits.
+                    field_type = sys.intern(
+                        introspector.get_field_type(description.type_code, description)
+                    )
 
                     # Create domain ColumnInfo with proper field type inference
                     col_info = ColumnInfo(
@@ -319,37 +384,6 @@ def introspect_schema_django(
                     columns_info.append(col_info)
 
                 # --- Post-process: Mark Unique and FK based on Constraints/Relations ---
-                unique_single_column_names = set()
-                for c_data in constraints.values():
-                    if c_data.get("unique") and len(c_data.get("columns", [])) == 1:
-                        unique_single_column_names.add(c_data["columns"][0])
-                    # Also consider unique indexes
-                    if (
-                        c_data.get("index")
-                        and c_data.get("unique")
-                        and len(c_data.get("columns", [])) == 1
-                    ):
-                        unique_single_column_names.add(c_data["columns"][0])
-
-                fk_column_map: Dict[str, Tuple[str, str]] = (
-                    {}
-                )  # {fk_col_name: (target_table, target_col)}
-                # Prefer 'relations' output if available
-                if relations:
-                    for fk_col, (target_col, target_table) in relations.items():
-                        fk_column_map[fk_col] = (target_table, target_col)
-                else:  # Fallback to parsing 'constraints' for FK info
-                    for c_data in constraints.values():
-                        if c_data.get("foreign_key") and isinstance(
-                            c_data.get("foreign_key"), tuple
-                        ):
-                            fk_cols = c_data.get("columns", [])
-                            target_table, target_col = c_data[
-                                "foreign_key"
-                            ]  # Assumes single target col
-                            if len(fk_cols) == 1:  # Only handle single column FKs here
-                                fk_column_map[fk_cols[0]] = (target_table, target_col)
-
                 # Apply flags to ColumnInfo objects
                 for col in columns_info:
                     if col.name in unique_single_column_names:
@@ -359,19 +393,6 @@ def introspect_schema_django(
                         col.foreign_key_to = fk_column_map[col.name]
 
                 # --- Create Domain TableInfo ---
-                # Convert raw constraints to domain constraint models if needed
-                constraint_infos = []
-                for constraint_name, constraint_data in constraints.items():
-                    constraint_info = ConstraintInfo(
-                        name=constraint_name,
-                        constraint_type=_map_constraint_type(constraint_data),
-                        columns=constraint_data.get('columns', []),
-                        definition=constraint_data.get('definition'),
-                        is_deferrable=constraint_data.get('is_deferrable', False),
-                        initially_deferred=constraint_data.get('initially_deferred', False)
-                    )
-                    constraint_infos.append(constraint_info)
-
                 table_info = TableInfo(
                     name=table_name,
                     columns=columns_info,
@@ -385,13 +406,14 @@ def introspect_schema_django(
                 processed_tables.add(table_name)
 
         logger.info(
-            f"Django introspection complete. Successfully processed {len(all_tables_info)} tables."
+            "Django introspection complete. Successfully processed %d tables.",
+            len(all_tables_info),
         )
         return all_tables_info
 
     except Exception as e:
         logger.error(
-            f"Unexpected error during Django introspection: {e}", exc_info=True
+            "Unexpected error during Django introspection: %s", e, exc_info=True
         )
         # Depending on where it happened, might return partial results or empty
         return all_tables_info if all_tables_info else []
@@ -30,7 +30,7 @@ from drf_auto_generator.domain.field_mapping import FieldMapper as DomainFieldMa
 from drf_auto_generator.domain.relationships import RelationshipAnalyzer
 from drf_auto_generator.domain.constraints import ConstraintAnalyzer
 from drf_auto_generator.constants import (
-    DjangoFieldTypes, DJANGO_FIELD_MAP, OPENAPI_TYPE_MAP,
+    DjangoFieldTypes, get_openapi_type_map, map_django_field,
     FieldCategories, RelationshipDefaults
 )
 from drf_auto_generator.domain.naming import NamingConventions, clean_field_name, to_pascal_case
@@ -58,7 +58,7 @@ def map_db_type_to_django(col: ColumnInfo, table_info: TableInfo = None) -> Tupl
     """Maps DB type string (from Django introspection) to Django model field type and options."""
 
     # 1. Get the base Django field type from mapping
-    field_type = DJANGO_FIELD_MAP.get(col.db_type_string, DjangoFieldTypes.TEXT_FIELD)
+    field_type = map_django_field(col.db_type_string)
 
     # 2. Base Options from ColumnInfo attributes
     options: Dict[str, Any] = {}
@@ -172,7 +172,7 @@ def map_db_type_to_openapi(col: ColumnInfo) -> Dict[str, Any]:
 
     # Instead of calling map_db_type_to_django with table_info=None (which is fragile),
     # we'll determine the Django field type locally with simpler logic for OpenAPI purposes
-    field_type = DJANGO_FIELD_MAP.get(col.db_type_string, DjangoFieldTypes.TEXT_FIELD)
+    field_type = map_django_field(col.db_type_string)
 
     # For OpenAPI purposes, we treat all primary key integer fields as AutoField
     # since we don't have table context to determine if it's composite
@@ -185,7 +185,8 @@ def map_db_type_to_openapi(col: ColumnInfo) -> Dict[str, Any]:
             field_type = DjangoFieldTypes.AUTO_FIELD
 
     # Get the base schema from the OpenAPI map
-    schema = OPENAPI_TYPE_MAP.get(field_type, OPENAPI_TYPE_MAP["Unknown"]).copy()
+    openapi_type_map = get_openapi_type_map()
+    schema = openapi_type_map.get(field_type, openapi_type_map["Unknown"]).copy()
 
     # Apply constraints/details from ColumnInfo to the schema
     schema["nullable"] = col.nullable
@@ -57,12 +57,13 @@ class DatabaseValidator:
             result.add_error("Database engine is required")
             return result
 
-        if engine not in SupportedDatabases.ALL:
+        caps = SupportedDatabases.ENGINES.get(engine)
+        if caps is None:
             result.add_error(f"Unsupported database engine: {engine}")
             result.add_error(f"Supported engines: {', '.join(SupportedDatabases.ALL)}")
             return result
 
-        if engine not in SupportedDatabases.SUPPORTED:
+        if not caps.supported:
             result.add_warning(f"Database engine '{engine}' has limited support")
 
         return result
@@ -84,8 +85,12 @@ class DatabaseValidator:
             result.add_error("Database name is required")
             return result
 
+        caps = SupportedDatabases.ENGINES.get(engine)
+        if caps is None:
+            return result
+
         # SQLite-specific validation
-        if engine == SupportedDatabases.SQLITE:
+        if caps.file_based:
             if user or password or host or port:
                 result.add_warning("SQLite doesn't use user/password/host/port parameters")
 
@@ -96,7 +101,7 @@ class DatabaseValidator:
                     result.add_error(f"SQLite database directory doesn't exist: {db_path.parent}")
 
         # PostgreSQL/MySQL validation
-        elif engine in [SupportedDatabases.POSTGRESQL, SupportedDatabases.MYSQL]:
+        elif caps.supported:
             if not user:
                 result.add_error("Database user is required for PostgreSQL/MySQL")
 
@@ -107,10 +112,8 @@ class DatabaseValidator:
             if port is not None:
                 if port < 1 or port > 65535:
                     result.add_error(f"Invalid port number: {port}")
-                elif engine == SupportedDatabases.POSTGRESQL and port != 5432:
-                    result.add_warning(f"Non-standard PostgreSQL port: {port}")
-                elif engine == SupportedDatabases.MYSQL and port != 3306:
-                    result.add_warning(f"Non-standard MySQL port: {port}")
+                elif port != caps.default_port:
+                    result.add_warning(f"Non-standard {caps.display_name} port: {port}")
 
         return result
 
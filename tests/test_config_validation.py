@@ -0,0 +1,223 @@
+"""
+Unit tests for config_validation.py schema validators.
+"""
+import asyncio
+import tempfile
+import unittest
+from argparse import Namespace
+from pathlib import Path
+
+import yaml
+from pydantic import ValidationError
+
+from drf_auto_generator.config_validation import (
+    DatabaseSettings,
+    ToolConfigSchema,
+    load_config,
+    load_config_async,
+    validate_and_parse_config,
+)
+from drf_auto_generator.exceptions import ConfigurationError
+
+
+def _base_config(**overrides):
+    config = {
+        "databases": {
+            "default": {
+                "ENGINE": "django.db.backends.sqlite3",
+                "NAME": "db.sqlite3",
+            }
+        }
+    }
+    config.update(overrides)
+    return config
+
+
+class TestDatabaseSettingsPort(unittest.TestCase):
+    """Test DatabaseSettings.PORT validation."""
+
+    def _settings(self, port):
+        return DatabaseSettings(ENGINE="django.db.backends.postgresql", NAME="db", PORT=port)
+
+    def test_string_port_is_converted(self):
+        """Test numeric strings are converted."""
+        self.assertEqual(self._settings("5432").PORT, 5432)
+
+    def test_empty_port_is_none(self):
+        """Test empty values map to None."""
+        self.assertIsNone(self._settings("").PORT)
+        self.assertIsNone(self._settings(None).PORT)
+
+    def test_non_numeric_port_rejected(self):
+        """Test non-numeric strings are rejected."""
+        with self.assertRaises(ValidationError):
+            self._settings("54a2")
+
+    def test_signed_or_padded_port_rejected(self):
+        """Test strings int() would tolerate but are not plain digits are rejected."""
+        for port in ("+8000", " 80 ", "8_000"):
+            with self.subTest(port=port):
+                with self.assertRaises(ValidationError):
+                    self._settings(port)
+
+    def test_settings_are_frozen(self):
+        """Test validated connection settings cannot be reassigned."""
+        settings = self._settings(5432)
+
+        with self.assertRaises(ValidationError):
+            settings.PORT = 6543
+
+    def test_out_of_range_port_rejected(self):
+        """Test ports outside 0-65535 are rejected."""
+        with self.assertRaises(ValidationError):
+            self._settings(70000)
+        with self.assertRaises(ValidationError):
+            self._settings("-1")
+
+
+class TestTableNameLists(unittest.TestCase):
+    """Test include_tables/exclude_tables validation."""
+
+    def test_table_names_are_stripped(self):
+        """Test whitespace around table names is removed."""
+        config = ToolConfigSchema.model_validate(
+            _base_config(include_tables=[" users ", "posts"])
+        )
+
+        self.assertEqual(config.include_tables, frozenset({"users", "posts"}))
+
+    def test_table_names_are_deduplicated_into_frozenset(self):
+        """Test table lists are stored as frozensets for membership checks."""
+        config = ToolConfigSchema.model_validate(
+            _base_config(exclude_tables=["logs", "logs ", "audit"])
+        )
+
+        self.assertIsInstance(config.exclude_tables, frozenset)
+        self.assertEqual(config.exclude_tables, frozenset({"logs", "audit"}))
+        self.assertEqual(
+            ToolConfigSchema.model_validate(config.model_dump()).exclude_tables,
+            config.exclude_tables,
+        )
+
+    def test_tuple_and_set_inputs_accepted(self):
+        """Test tuples, sets and frozensets are normalised the same way as lists."""
+        for tables in (
+            (" users ", "posts"), {" users ", "posts"}, frozenset({" users ", "posts"})
+        ):
+            with self.subTest(tables=tables):
+                config = ToolConfigSchema.model_validate(
+                    _base_config(include_tables=tables)
+                )
+                self.assertEqual(config.include_tables, frozenset({"users", "posts"}))
+
+    def test_blank_item_in_frozenset_rejected(self):
+        """Test frozensets are validated rather than passed through."""
+        with self.assertRaises(ValidationError):
+            ToolConfigSchema.model_validate(
+                _base_config(include_tables=frozenset({"users", ""}))
+            )
+
+    def test_bare_string_rejected(self):
+        """Test a single table name must still be wrapped in a collection."""
+        with self.assertRaises(TypeError) as context:
+            ToolConfigSchema.model_validate(_base_config(include_tables="users"))
+
+        self.assertIn("list, tuple or set", str(context.exception))
+
+    def test_none_is_allowed(self):
+        """Test table lists are optional."""
+        config = ToolConfigSchema.model_validate(_base_config())
+
+        self.assertIsNone(config.include_tables)
+        self.assertIsNone(config.exclude_tables)
+
+    def test_non_string_item_rejected(self):
+        """Test non-string entries are rejected (TypeError is not wrapped by Pydantic)."""
+        with self.assertRaises(TypeError) as context:
+            ToolConfigSchema.model_validate(_base_config(exclude_tables=["users", 42]))
+
+        self.assertIn("index 1", str(context.exception))
+
+    def test_blank_item_rejected(self):
+        """Test empty or whitespace-only entries raise a validation error."""
+        with self.assertRaises(ValidationError) as context:
+            ToolConfigSchema.model_validate(_base_config(include_tables=["users", "   "]))
+
+        self.assertIn("index 1", str(context.exception))
+
+
+class TestValidateAndParseConfig(unittest.TestCase):
+    """Test error reporting in validate_and_parse_config."""
+
+    def test_errors_are_logged_in_one_record(self):
+        """Test all validation errors are reported together."""
+        config = _base_config(project_name="1bad", include_tables=["users", "   "])
+
+        with self.assertLogs("drf_auto_generator.config_validation", level="ERROR") as logs:
+            with self.assertRaises(ConfigurationError) as context:
+                validate_and_parse_config(config)
+
+        error_records = [r for r in logs.records if r.levelname == "ERROR"]
+        self.assertEqual(len(error_records), 1)
+        self.assertIn("project_name", error_records[0].getMessage())
+        self.assertIn("include_tables", error_records[0].getMessage())
+        self.assertEqual(len(context.exception.context["validation_errors"]), 2)
+
+    def test_hint_is_added_for_known_error_type(self):
+        """Test a hint is looked up from the Pydantic error type."""
+        config = _base_config(relation_style="embedded")
+
+        with self.assertLogs("drf_auto_generator.config_validation", level="ERROR") as logs:
+            with self.assertRaises(ConfigurationError):
+                validate_and_parse_config(config)
+
+        self.assertIn("Hint: Use one of the allowed values", "\n".join(logs.output))
+
+
+class TestLoadConfig(unittest.TestCase):
+    """Test load_config merging of YAML and CLI arguments."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.config_path = Path(self.temp_dir.name) / "config.yaml"
+        self.config_path.write_text(yaml.safe_dump(_base_config()))
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_cli_argument_overrides_config_value(self):
+        """Test explicitly given CLI arguments override config values."""
+        output_dir = Path(self.temp_dir.name) / "out"
+        cli_args = Namespace(
+            config=str(self.config_path), output_dir=str(output_dir), verbose=False
+        )
+
+        config = load_config(str(self.config_path), cli_args)
+
+        self.assertEqual(config.output_dir, str(output_dir.resolve()))
+
+    def test_unset_cli_arguments_are_ignored(self):
+        """Test CLI arguments left as None keep the config defaults."""
+        config = load_config(str(self.config_path), Namespace(output_dir=None))
+
+        self.assertEqual(config.project_name, "myapi_django")
+        self.assertTrue(config.SECRET_KEY.get_secret_value())
+
+    def test_secret_key_is_masked(self):
+        """Test the generated SECRET_KEY does not appear in the config repr."""
+        config = load_config(str(self.config_path), Namespace(output_dir=None))
+
+        self.assertNotIn(config.SECRET_KEY.get_secret_value(), repr(config))
+
+    def test_load_config_async_matches_sync(self):
+        """Test the async loader returns the same validated config."""
+        cli_args = Namespace(output_dir=None)
+
+        async_config = asyncio.run(load_config_async(str(self.config_path), cli_args))
+        sync_config = load_config(str(self.config_path), cli_args)
+
+        self.assertEqual(async_config, sync_config)
+
+
+if __name__ == "__main__":
+    unittest.main()